@@ -0,0 +1,28 @@
+"""Bulk-write helpers: split large batches into dialect-sized chunks."""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from sqlalchemy.orm import Session
+
+# Rows per statement for bulk writes. Loaders stop improving (or regress) past
+# a dialect-specific batch size, so large loads are split at these sizes and
+# still committed once by the caller.
+CHUNK_SIZES: Dict[str, int] = {
+    "postgresql": 5000,
+    "sqlite": 1000,
+    "mysql": 20000,
+}
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def chunk_size_for(session: Session) -> int:
+    """Return the bulk-write chunk size for the session's database dialect."""
+    return CHUNK_SIZES.get(session.get_bind().dialect.name, DEFAULT_CHUNK_SIZE)
+
+
+def iter_chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive lists of at most ``size`` items from ``rows``."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
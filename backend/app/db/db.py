@@ -1,8 +1,28 @@
+import logging
 import os
+from datetime import date
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back on bad input."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Invalid %s value %r; falling back to default %s", name, raw, default)
+        return default
+
 
 # SQLAlchemy Database URL (SQLite for simplicity).
 # Default DB path is anchored to backend/app.db so running from workspace root
@@ -10,14 +30,129 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 DEFAULT_SQLITE_PATH = (Path(__file__).resolve().parents[2] / "app.db").as_posix()
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DEFAULT_SQLITE_PATH}")
 
+# Size of SQLAlchemy's compiled-statement cache (per engine). The default (500)
+# is easily churned by ORM queries across all models; a larger cache keeps the
+# hot read paths from re-compiling SQL on every request.
+QUERY_CACHE_SIZE = _env_int("DB_QUERY_CACHE_SIZE", 1200)
+
+# Connection pool settings. Server databases use all of them; file-backed
+# SQLite takes the size/overflow/timeout so its QueuePool (5 + 10 by default)
+# is not smaller than the threadpool that serves sync routes.
+# LIFO reuse keeps the most recently used (warm) connections busy and lets
+# surplus overflow connections sit idle long enough to be recycled.
+POOL_SIZE = _env_int("DB_POOL_SIZE", 20)
+MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 30)
+POOL_TIMEOUT = _env_int("DB_POOL_TIMEOUT", 30)
+POOL_RECYCLE = _env_int("DB_POOL_RECYCLE", 1800)
+# Behind an external pooler such as PgBouncer (transaction pooling), set
+# DB_USE_NULL_POOL=1 so each checkout opens a fresh pooler connection and the
+# pooler alone decides how many server connections exist.
+USE_NULL_POOL = os.getenv("DB_USE_NULL_POOL", "").strip().lower() in ("1", "true", "yes")
+
+# Worker threads available to sync (`def`) routes, which is where every DB
+# call runs. AnyIO's default of 40 leaves part of a 20 + 30 server pool idle
+# under load, so server databases default to one thread per pooled
+# connection. SQLite keeps the AnyIO default.
+THREADPOOL_SIZE = _env_int(
+    "THREADPOOL_SIZE",
+    40 if DATABASE_URL.startswith("sqlite") else POOL_SIZE + MAX_OVERFLOW,
+)
+
 # Create engine with SQLite-specific connection args only for SQLite
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    sqlite_pool_kwargs: dict = {}
+    if make_url(DATABASE_URL).database not in (None, "", ":memory:"):
+        # In-memory databases use SingletonThreadPool, which has no overflow.
+        sqlite_pool_kwargs = {
+            "pool_size": POOL_SIZE,
+            "max_overflow": MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT,
+        }
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        query_cache_size=QUERY_CACHE_SIZE,
+        future=True,
+        **sqlite_pool_kwargs,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers proceed alongside the single writer, and NORMAL sync
+        # only fsyncs at checkpoints, which is still safe in WAL mode.
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        finally:
+            cursor.close()
 else:
-    engine = create_engine(DATABASE_URL)
+    engine_kwargs: dict
+    if USE_NULL_POOL:
+        engine_kwargs = {"poolclass": NullPool}
+    else:
+        engine_kwargs = {
+            "pool_size": POOL_SIZE,
+            "max_overflow": MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT,
+            "pool_recycle": POOL_RECYCLE,
+            "pool_pre_ping": True,
+            "pool_use_lifo": True,
+        }
+    if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+        # psycopg2 fast-execution helpers: multi-row INSERTs (including the ones
+        # Session.flush() emits for several pending objects, e.g. from
+        # TransactionService.create_many) are sent as INSERT ... VALUES (...), (...)
+        # pages, and UPDATE/DELETE executemany batches via execute_batch,
+        # instead of one round-trip per row.
+        engine_kwargs.update(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+        )
+    engine = create_engine(DATABASE_URL, query_cache_size=QUERY_CACHE_SIZE, **engine_kwargs)
 
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
+
+
+def warm_query_cache() -> None:
+    """Execute the hottest read queries once so their compiled SQL is cached.
+
+    Literal values become bound parameters, so running each query with a
+    sentinel id produces the same cache key that real requests will hit.
+    Failures (e.g. tables not migrated yet) are logged and never block startup.
+    """
+    # Imported lazily: the models themselves import `Base` from this module.
+    from app.models.card_bonus_category import CardBonusCategory
+    from app.models.card_catalogue import CardCatalogue
+    from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
+    from app.models.user_profile import UserProfile
+    from app.services.recommendation_service import STMT_CYCLE_SPEND
+    from app.services.transaction_service import STMT_TX_BY_USER
+
+    db = SessionLocal()
+    try:
+        db.query(UserProfile).filter(UserProfile.id == -1).first()
+        db.query(CardCatalogue).all()
+        db.query(CardCatalogue).filter(CardCatalogue.card_id.in_([-1])).all()
+        db.query(CardBonusCategory).filter(CardBonusCategory.card_id.in_([-1])).all()
+        (
+            db.query(UserOwnedCard)
+            .filter(UserOwnedCard.user_id == -1)
+            .filter(UserOwnedCard.status == UserOwnedCardStatus.Active)
+            .all()
+        )
+        db.execute(STMT_TX_BY_USER, {"user_id": -1}).all()
+        db.execute(
+            STMT_CYCLE_SPEND,
+            {"user_id": -1, "card_ids": [-1], "since": date.today()},
+        ).all()
+    except SQLAlchemyError:
+        logger.warning("Skipping query cache warm-up; database not ready.", exc_info=True)
+    finally:
+        db.close()
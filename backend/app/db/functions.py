@@ -0,0 +1,44 @@
+"""Portable SQL expressions for server-side column defaults."""
+
+from sqlalchemy import Date, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Current UTC timestamp, evaluated by the database.
+
+    Matches what `datetime.utcnow()` produced for naive DateTime columns:
+    PostgreSQL's CURRENT_TIMESTAMP follows the session time zone, so it is
+    converted explicitly; SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+class end_of_month(FunctionElement):
+    """Last day of the current month, evaluated by the database."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(end_of_month)
+def _default_end_of_month(element, compiler, **kw):
+    return "date('now', 'start of month', '+1 month', '-1 day')"
+
+
+@compiles(end_of_month, "postgresql")
+def _pg_end_of_month(element, compiler, **kw):
+    return "(date_trunc('month', CURRENT_DATE) + interval '1 month - 1 day')::date"
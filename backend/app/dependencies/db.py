@@ -1,8 +1,10 @@
 from app.db.db import SessionLocal
 
 def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+    """One session per request; uncommitted work is rolled back if the request fails."""
+    with SessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
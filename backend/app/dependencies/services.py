@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
@@ -8,6 +10,13 @@ from app.services.catalog_service import CatalogService
 from app.services.transaction_service import TransactionService
 from app.services.user_card_service import UserCardManagementService
 from app.services.rewards_earned_service import RewardsEarnedService
+from app.services.recommendation_service import RecommendationService
+
+@lru_cache(maxsize=1)
+def get_cognito_service() -> CognitoService:
+    # CognitoService holds no per-request state (only config, a boto3 client and
+    # the lazily fetched JWKS), so one shared instance serves every request.
+    return CognitoService()
 
 def get_catalog_service(db: Session = Depends(get_db)) -> CatalogService:
     return CatalogService(db)
@@ -26,3 +35,7 @@ def get_user_card_management_service(db: Session = Depends(get_db)) -> UserCardM
 def get_transaction_service(db: Session = Depends(get_db)) -> TransactionService:
     # Creates and returns a TransactionService instance using the injected database session.
     return TransactionService(db)
+
+def get_recommendation_service(db: Session = Depends(get_db)) -> RecommendationService:
+    # Creates and returns a RecommendationService instance using the injected database session.
+    return RecommendationService(db)
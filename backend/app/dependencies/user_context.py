@@ -5,7 +5,10 @@ from typing import Any, Optional
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.dependencies.services import get_cognito_service
 from app.services.cognito_service import CognitoService
+from app.services.errors import ServiceError
+from app.services.user_id_utils import parse_user_id
 
 
 _bearer_scheme = HTTPBearer(auto_error=False)
@@ -13,18 +16,38 @@ _bearer_scheme = HTTPBearer(auto_error=False)
 
 def get_x_user_id(request: Request) -> Optional[str]:
     """Return raw x-user-id header value (stripped) or None."""
-    value = request.headers.get("x-user-id")
-    if not value:
-        return None
-    value = value.strip()
-    return value or None
+    # ASGI header names are already lower-cased bytes, so scanning the raw
+    # list skips building `request.headers` and its case-folding lookup.
+    for name, raw_value in request.scope["headers"]:
+        if name == b"x-user-id":
+            value = raw_value.decode("latin-1").strip()
+            return value or None
+    return None
+
+
+def require_x_user_id(x_user_id: Optional[str] = Depends(get_x_user_id)) -> str:
+    """Return the x-user-id header value, rejecting the request with 401 if absent.
+
+    Dependencies are resolved before the request body is validated, so routes
+    that take a body skip that work for unauthenticated calls.
+    """
+    if not x_user_id:
+        raise ServiceError(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            code="UNAUTHORIZED",
+            message="Missing or invalid user context.",
+            details={"required_header": "x-user-id"},
+        )
+    return x_user_id
 
 
 def get_x_user_id_int(x_user_id: Optional[str] = Depends(get_x_user_id)) -> Optional[int]:
-    """Return x-user-id as int if it's a plain integer string, else None."""
-    if x_user_id and x_user_id.isdigit():
-        return int(x_user_id)
-    return None
+    """Return x-user-id as int ("42" or "u_042"), else None.
+
+    Uses the same parser as the transaction service, so one header value
+    always names the same user.
+    """
+    return parse_user_id(x_user_id)
 
 
 def get_bearer_credentials(
@@ -40,7 +63,7 @@ def get_bearer_credentials(
 
 def get_cognito_claims(
     auth: HTTPAuthorizationCredentials = Depends(get_bearer_credentials),
-    cognito_service: CognitoService = Depends(CognitoService),
+    cognito_service: CognitoService = Depends(get_cognito_service),
 ) -> dict[str, Any]:
     return cognito_service.validate_token(auth)
 
@@ -57,6 +80,7 @@ def get_cognito_sub(claims: dict[str, Any] = Depends(get_cognito_claims)) -> str
 
 __all__ = [
     "get_x_user_id",
+    "require_x_user_id",
     "get_x_user_id_int",
     "get_cognito_sub",
     "get_cognito_claims",
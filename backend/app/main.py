@@ -2,10 +2,10 @@ import os
 import sys
 from pathlib import Path
 
+import anyio.to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from slowapi.errors import RateLimitExceeded
-from fastapi.responses import JSONResponse
 
 # Add backend directory to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -19,7 +19,7 @@ load_dotenv()
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
@@ -34,16 +34,25 @@ from app.routes import (
     auth_router,
     notifications_router,
 )
+from app.db.db import THREADPOOL_SIZE, warm_query_cache
+from app.responses import AppJSONResponse
 from app.services import init_sample_data
+from app.services.card_reasoner_service import audit_log_buffer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler - runs on startup and shutdown"""
     # Startup
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     init_sample_data()
+    warm_query_cache()
+    # Build and cache the OpenAPI schema now so no client pays first-hit cost.
+    app.openapi()
+    await audit_log_buffer.start()
     yield
     # Shutdown
+    await audit_log_buffer.stop()
 
 
 app = FastAPI(
@@ -51,7 +60,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     openapi_url="/api/openapi.json",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=AppJSONResponse,
 )
 
 # CORS middleware - MUST be added first before other middlewares
@@ -72,13 +82,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
+    # Let browsers cache preflight responses for a day instead of sending an
+    # OPTIONS round-trip before every cross-origin request.
+    max_age=86400,
 )
 
+# Compress larger payloads (transaction histories, the OpenAPI schema, ranked
+# recommendations and LLM explanations). SSE streams are never buffered.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc: RequestValidationError):  # type: ignore[override]
     """Handle validation errors with HTTP 400 to maintain backward compatibility with API contract."""
-    return JSONResponse(
+    return AppJSONResponse(
         status_code=400,
         content={
             "error": {
@@ -96,7 +113,7 @@ async def general_exception_handler(request, exc: Exception):  # type: ignore[ov
     import traceback
     traceback.print_exc()
     print(f"Error: {exc}")
-    return JSONResponse(
+    return AppJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -109,7 +126,7 @@ async def general_exception_handler(request, exc: Exception):  # type: ignore[ov
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
+    return AppJSONResponse(
         status_code=429,
         content={"detail": "Rate limit exceeded. Try again later."}
     )
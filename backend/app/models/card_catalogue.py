@@ -1,8 +1,7 @@
 from sqlalchemy import Column, Integer, String, Numeric, Enum as SAEnum, CheckConstraint, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.orm import relationship
 from app.db.db import Base
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 from enum import Enum as PyEnum
 from decimal import Decimal
 from datetime import date
@@ -74,22 +73,6 @@ class CardCatalogue(Base):
         cascade="all, delete-orphan",
     )
 
-    bonus_categories = relationship(
-        "CardBonusCategory",
-        back_populates="card_catalogue",
-        cascade="all, delete-orphan",
-    )
-    user_owned_cards = relationship(
-        "UserOwnedCard",
-        back_populates="card_catalogue",
-        cascade="all, delete-orphan",
-    )
-    transactions = relationship(
-        "UserTransaction",
-        back_populates="card_catalogue",
-        cascade="all, delete-orphan",
-    )
-
 # Pydantic Models for Request/Response
 class CardCatalogueBase(BaseModel):
     bank: BankEnum
@@ -136,6 +119,11 @@ class CardCatalogueResponse(CardCatalogueBase):
     card_id: int
 
 
+# Built once at import: the catalog endpoint caches the JSON bytes dumped
+# through this adapter.
+CATALOG_LIST_ADAPTER = TypeAdapter(list[CardCatalogueResponse])
+
+
 class CardBonusRuleUpdate(BaseModel):
     bonus_category: BonusCategory
     bonus_benefit_rate: Decimal
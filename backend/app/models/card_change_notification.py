@@ -1,10 +1,9 @@
 from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, JSON, String
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, JSON, String, func
 
 from app.db.db import Base
-from app.services.datetime_utils import utc_now
 
 
 class CardChangeNotification(Base):
@@ -17,7 +16,7 @@ class CardChangeNotification(Base):
     changed_fields = Column(JSON, nullable=False, default=dict)
     effective_date = Column(Date, nullable=False)
     is_read = Column(Boolean, nullable=False, default=False)
-    created_date = Column(DateTime(timezone=True), nullable=False, default=utc_now, index=True)
+    created_date = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
 
 
 class CardChangeNotificationBase(BaseModel):
@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Integer, Numeric, String, DateTime, Date, Boolean, Enum as SAEnum, ForeignKey
+from sqlalchemy import Column, Identity, Integer, Numeric, String, DateTime, Date, Boolean, CheckConstraint, ForeignKey, Index, func
 from app.db.db import Base
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from sqlalchemy.orm import relationship
 from datetime import datetime, date
 from enum import Enum as PyEnum
+from functools import lru_cache
 from decimal import Decimal
-from typing import Optional
 
 
 def _enum_values(enum_cls):
@@ -13,6 +13,20 @@ def _enum_values(enum_cls):
     return [member.value for member in enum_cls]
 
 
+@lru_cache(maxsize=None)
+def _enum_lookup(enum_cls) -> dict:
+    """Case-insensitive value/name -> member map, built once per enum.
+
+    Values take precedence over names, and earlier members over later ones.
+    """
+    lookup = {}
+    for member in enum_cls:
+        lookup.setdefault(str(member.value).lower(), member)
+    for member in enum_cls:
+        lookup.setdefault(member.name.lower(), member)
+    return lookup
+
+
 def _normalize_enum_input(value, enum_cls):
     """Normalize free-form enum strings from clients to enum members."""
     if value is None or isinstance(value, enum_cls):
@@ -22,21 +36,20 @@ def _normalize_enum_input(value, enum_cls):
         raw = value.strip()
         if not raw:
             return value
+        # Accept enum values or member names case-insensitively.
+        return _enum_lookup(enum_cls).get(raw.lower(), value)
 
-        lowered = raw.lower()
-        # Accept enum values case-insensitively.
-        for member in enum_cls:
-            if str(member.value).lower() == lowered:
-                return member
+    return value
 
-        # Accept enum member names case-insensitively.
-        for member in enum_cls:
-            if member.name.lower() == lowered:
-                return member
 
-    return value
+def _enum_check(column: str, enum_cls) -> CheckConstraint:
+    """CHECK constraint limiting a plain string column to the enum's values."""
+    allowed = ", ".join(f"'{value}'" for value in _enum_values(enum_cls))
+    return CheckConstraint(f"{column} IN ({allowed})", name=f"ck_transactions_{column}")
 
-class TransactionCategory(PyEnum):
+# The transaction enums mix in `str` so members bind directly to the String
+# columns below; rows loaded from the DB carry the plain value strings.
+class TransactionCategory(str, PyEnum):
     food = "Food"
     transport = "Transport"
     fashion = "Fashion"
@@ -49,14 +62,14 @@ class TransactionCategory(PyEnum):
     Entertainment = "Entertainment"
     Others = "Others"
 
-class TransactionChannel(PyEnum):
+class TransactionChannel(str, PyEnum):
     online = "online"
     offline = "offline"
     # Backward-compatible legacy values found in older data.
     Online = "Online"
     Offline = "Offline"
 
-class TransactionStatus(PyEnum):
+class TransactionStatus(str, PyEnum):
     Active = "active"
     DeletedWithCard = "deleted_with_card"
     # Backward-compatible legacy values found in older data.
@@ -65,17 +78,37 @@ class TransactionStatus(PyEnum):
 
 class UserTransaction(Base):
     __tablename__ = "transactions"
-    id = Column(Integer, primary_key=True, index=True)
+    # Enum-valued columns are stored as String + CHECK rather than SAEnum so
+    # bulk inserts/loads skip the per-value enum type coercion.
+    __table_args__ = (
+        _enum_check("channel", TransactionChannel),
+        _enum_check("category", TransactionCategory),
+        _enum_check("status", TransactionStatus),
+        # Back the per-user history and per-card billing-cycle date-range queries.
+        Index("ix_tx_user_date", "user_id", "transaction_date"),
+        Index("ix_tx_card_date", "card_id", "transaction_date"),
+        # Exact predicate of the per-card cycle-spend SUM; on PostgreSQL the
+        # INCLUDE makes it covering, so the sum is an index-only range scan.
+        Index(
+            "ix_tx_user_card_date",
+            "user_id",
+            "card_id",
+            "transaction_date",
+            postgresql_include=["amount_sgd"],
+        ),
+    )
+    id = Column(Integer, Identity(), primary_key=True)
     user_id = Column(Integer, ForeignKey("user_profile.id", ondelete="CASCADE"), nullable=False)
     card_id = Column(Integer, ForeignKey("card_catalogue.card_id", ondelete="CASCADE"), nullable=False)
     amount_sgd = Column(Numeric(10,2), nullable=False)
     item = Column(String, nullable=False)
-    channel = Column(SAEnum(TransactionChannel, values_callable=_enum_values), nullable=False)
-    category = Column(SAEnum(TransactionCategory, values_callable=_enum_values), nullable=True)
+    channel = Column(String(16), nullable=False)
+    category = Column(String(16), nullable=True)
     is_overseas = Column(Boolean, nullable=False)
-    transaction_date = Column(Date, default=date.today, nullable=False)
-    status = Column(SAEnum(TransactionStatus, values_callable=_enum_values), default=TransactionStatus.Active, nullable=False)
-    created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Date columns are filled by the database so bulk INSERT rows can omit them.
+    transaction_date = Column(Date, server_default=func.current_date(), nullable=False)
+    status = Column(String(32), default=TransactionStatus.Active.value, nullable=False)
+    created_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationship with UserProfile
     user_profile = relationship("UserProfile", back_populates="user_transactions")
@@ -92,7 +125,8 @@ class TransactionCreate(BaseModel):
     item: str
     channel: TransactionChannel  # "online" or "offline"
     is_overseas: bool = False
-    transaction_date: date | None = Field(default=None, alias="date")  # YYYY-MM-DD, defaults to today if omitted
+    # Parsed natively by pydantic-core (YYYY-MM-DD); services default it to today.
+    transaction_date: date | None = Field(default=None, alias="date")
     category: TransactionCategory | None = None
     status: TransactionStatus = TransactionStatus.Active
 
@@ -125,11 +159,6 @@ class TransactionCreate(BaseModel):
     def normalize_status(cls, v):
         return _normalize_enum_input(v, TransactionStatus)
 
-    @field_validator("transaction_date", mode="before")
-    @classmethod
-    def set_transaction_date(cls, v):
-        return date.today() if v is None else v
-
 class TransactionResponse(TransactionCreate):
     """Transaction response model"""
     id: int
@@ -173,3 +202,7 @@ class TransactionUpdate(BaseModel):
 class TransactionRequest(BaseModel):
     """Wrapper for API contract - POST body"""
     transaction: TransactionCreate
+
+class TransactionBatchRequest(BaseModel):
+    """Wrapper for API contract - POST /batch body"""
+    transactions: list[TransactionCreate] = Field(min_length=1)
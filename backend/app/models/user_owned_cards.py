@@ -1,12 +1,15 @@
 from typing import Optional
-from sqlalchemy import Column, Date, Integer, String, DateTime, Enum as SAEnum, ForeignKey
+from sqlalchemy import CheckConstraint, Column, Date, Identity, Integer, String, ForeignKey
 from app.db.db import Base
-from pydantic import BaseModel, ConfigDict, field_validator, Field
+from app.db.functions import end_of_month
+from pydantic import BaseModel, ConfigDict, TypeAdapter, Field
 from sqlalchemy.orm import relationship
-from datetime import datetime, timedelta, date
+from datetime import date
 from enum import Enum as PyEnum
 
-class UserOwnedCardStatus(PyEnum):
+# `str` mixin: members bind directly to the String status column, and rows
+# loaded from the DB carry the plain value strings.
+class UserOwnedCardStatus(str, PyEnum):
     # Backward-compatible aliases (older code/tests used title-case names)
     Active = "Active"
     Inactive = "Suspended"
@@ -17,23 +20,21 @@ class UserOwnedCardStatus(PyEnum):
     inactive = "Suspended"
     closed = "Expired"
 
-def get_billing_cycle_date():
-    # return last day of current month
-    today = date.today()
-    # last day of the month
-    if today.month == 12:
-        return date(today.year, 12, 31)
-    else:
-        next_month = date(today.year, today.month + 1, 1)
-        return next_month - timedelta(days=1)
-
 class UserOwnedCard(Base):
     __tablename__ = "user_owned_cards"
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{member.value}'" for member in UserOwnedCardStatus)),
+            name="ck_user_owned_cards_status",
+        ),
+    )
+    id = Column(Integer, Identity(), primary_key=True)
     user_id = Column(Integer, ForeignKey("user_profile.id", ondelete="CASCADE"), nullable=False)
     card_id = Column(Integer, ForeignKey("card_catalogue.card_id", ondelete="CASCADE"), nullable=False)
-    card_expiry_date = Column(Date, default=lambda: date(9999,1,1), nullable=False)
-    billing_cycle_refresh_date = Column(Date, default=get_billing_cycle_date, nullable=False)
+    # NULL means the card has no expiry date.
+    card_expiry_date = Column(Date, nullable=True)
+    # Defaults to the last day of the current month, computed by the database.
+    billing_cycle_refresh_date = Column(Date, server_default=end_of_month(), nullable=False)
     # DB column created by Alembic is `billing_cycle_refresh_day_of_mth`.
     # Keep the Python attribute name for API/test compatibility.
     billing_cycle_refresh_day_of_month = Column(
@@ -43,7 +44,7 @@ class UserOwnedCard(Base):
         default=1,
         server_default="1",
     )
-    status = Column(SAEnum(UserOwnedCardStatus), nullable=False, default=UserOwnedCardStatus.Active)
+    status = Column(String(16), nullable=False, default=UserOwnedCardStatus.Active.value)
 
     # In-memory spend tracker (not persisted; avoids DB schema drift).
     cycle_spend_sgd: float = 0.0
@@ -67,8 +68,8 @@ class UserOwnedCardBase(BaseModel):
     card_id: int
 
 class UserOwnedCardCreate(UserOwnedCardBase):
-    card_expiry_date: date = date(9999,1,1)
-    billing_cycle_refresh_date: date = Field(default_factory=get_billing_cycle_date)
+    card_expiry_date: Optional[date] = None
+    billing_cycle_refresh_date: Optional[date] = None
     billing_cycle_refresh_day_of_month: int = Field(1, ge=1, le=31) 
 
 class UserOwnedCardUpdate(BaseModel):
@@ -79,7 +80,7 @@ class UserOwnedCardUpdate(BaseModel):
 
 class UserOwnedCardResponse(UserOwnedCardBase):
     id: int | None = None  # Optional for JSON-backed wallet
-    card_expiry_date: date
+    card_expiry_date: Optional[date] = None
     billing_cycle_refresh_date: date
     billing_cycle_refresh_day_of_month: int
     status: UserOwnedCardStatus
@@ -88,3 +89,8 @@ class UserOwnedCardWrappedResponse(BaseModel):
     """Envelope response for wallet endpoints."""
 
     wallet: list[UserOwnedCardResponse]
+
+
+# Built once at import: the wallet list endpoint validates ORM rows and dumps
+# JSON bytes through this adapter directly.
+WALLET_LIST_ADAPTER = TypeAdapter(list[UserOwnedCardResponse])
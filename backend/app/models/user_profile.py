@@ -1,13 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SAEnum
+from sqlalchemy import CheckConstraint, Column, Identity, Integer, String, DateTime, func
 from app.db.db import Base
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from app.services.datetime_utils import utc_now
-
-class BenefitsPreference(PyEnum):
+# `str` mixin: members bind directly to the String benefits_preference column,
+# and rows loaded from the DB carry the plain value strings.
+class BenefitsPreference(str, PyEnum):
     miles = "Miles"
     cashback = "Cashback"
     no_preference = "No preference"
@@ -19,31 +19,26 @@ class BenefitsPreference(PyEnum):
 
 class UserProfile(Base):
     __tablename__ = "user_profile"
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        CheckConstraint(
+            "benefits_preference IN ({})".format(", ".join(f"'{member.value}'" for member in BenefitsPreference)),
+            name="ck_user_profile_benefits_preference",
+        ),
+    )
+    id = Column(Integer, Identity(), primary_key=True)
     username = Column(String, nullable=False, unique=True)
     # Backward-compatible: some tests/fixtures still provide password_hash.
     password_hash = Column(String, nullable=False, default="", server_default="")
     name = Column(String, nullable=True)
     email = Column(String, nullable=True, unique=True)
     cognito_sub = Column(String, nullable=True, unique=True)  # Store Cognito user ID
-    benefits_preference = Column(SAEnum(BenefitsPreference), nullable=False, default=BenefitsPreference.no_preference)
-    created_date = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    benefits_preference = Column(String(16), nullable=False, default=BenefitsPreference.no_preference.value)
+    created_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 # Relationships with user-owned cards and transactions
     user_owned_cards = relationship("UserOwnedCard", back_populates="user_profile", cascade="all, delete-orphan")
     user_transactions = relationship("UserTransaction", back_populates="user_profile", cascade="all, delete-orphan")
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "username": self.username,
-            "name": self.name,
-            "email": self.email,
-            "cognito_sub": self.cognito_sub,
-            "benefits_preference": self.benefits_preference.value if self.benefits_preference else None,
-            "created_date": self.created_date,
-        }
-
 # Pydantic Models for Request/Response Validation
 class UserProfileBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
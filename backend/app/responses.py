@@ -0,0 +1,22 @@
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class AppJSONResponse(ORJSONResponse):
+    """Default API response: orjson encoding, with Decimal -> str and Enum -> value."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
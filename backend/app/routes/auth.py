@@ -81,7 +81,7 @@ def register(payload: RegistrationPayload, db: Session = Depends(get_db)):
                 "username": user.username,
                 "name": user.name,
                 "email": user.email,
-                "benefits_preference": user.benefits_preference.value if user.benefits_preference else None,
+                "benefits_preference": getattr(user.benefits_preference, "value", user.benefits_preference),
                 "created_date": user.created_date,
             },
         }
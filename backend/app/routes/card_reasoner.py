@@ -2,14 +2,20 @@
 Card Reasoner Route - API endpoints for credit card recommendation explanations.
 
 Endpoints:
-- POST /api/v1/card-reasoner/explain - Generate explanation (sync) [Legacy]
+- POST /api/v1/card-reasoner/explain - Generate explanation [Legacy]
 - POST /api/v1/card-reasoner/explain-db - Generate explanation from DB ground truth [NEW - TDD]
+- POST /api/v1/card-reasoner/explain-db/stream - Same, streamed as Server-Sent Events
 """
 
 from decimal import Decimal
 import logging
+from typing import AsyncIterator, Callable
 
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+import anyio
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.dependencies.db import get_db
@@ -17,11 +23,10 @@ from app.dependencies.user_context import get_x_user_id_int
 from app.services.card_reasoner_service import (
     ExplanationRequest as LegacyExplanationRequest,
     ExplanationResponse as LegacyExplanationResponse,
-    generate_explanation,
     generate_explanation_async,
-    save_audit_log
+    audit_log_buffer,
 )
-from app.services.explanation_service import ExplanationService
+from app.services.explanation_service import ExplanationService, ExplanationStreamInterrupted
 from app.services.security_log_service import log_genai_access_event
 from app.schemas.ai_schemas import ExplanationRequest, ExplanationResponse
 from pydantic import BaseModel, Field
@@ -78,71 +83,30 @@ class ExplainFromDBRequest(BaseModel):
     model_config = {"json_schema_extra": {"examples": [{"card_id": 3, "category": "Fashion", "transaction_amount": 120.00, "merchant_name": "ZARA"}]}}
 
 
-@router.post("/explain", response_model=LegacyExplanationResponse)
-def explain_recommendation(
+async def _explain(
     payload: LegacyExplanationRequest,
     request: Request,
-    db: Session = Depends(get_db),
-    user_id: int | None = Depends(get_x_user_id_int),
+    db: Session,
+    user_id: int | None,
+    *,
+    source: str,
+    endpoint: str,
 ) -> LegacyExplanationResponse:
-    """
-    Generate a natural language explanation for why a credit card was recommended.
-    
-    Args:
-        request: ExplanationRequest containing:
-            - transaction: Transaction details (merchant, amount, category)
-            - recommended_card: The recommended card with calculated value
-            - comparison_cards: Optional list of alternative cards considered
-    
-    Returns:
-        ExplanationResponse with:
-            - explanation: Natural language explanation for general users
-            - audit_log_entry: Audit trail entry for compliance/analytics
-    
-    Example:
-        POST /api/v1/card-reasoner/explain
-        {
-            "transaction": {
-                "merchant_name": "ZARA",
-                "amount": 120.00,
-                "category": "Fashion"
-            },
-            "recommended_card": {
-                "Card_ID": 3,
-                "Bank": "DBS",
-                "Card_Name": "DBS Live Fresh",
-                "Benefit_type": "Cashback",
-                "base_benefit_rate": 0.01,
-                "applied_bonus_rate": 0.035,
-                "total_calculated_value": 4.32
-            },
-            "comparison_cards": [
-                {
-                    "Card_ID": 5,
-                    "Bank": "OCBC",
-                    "Card_Name": "OCBC 365",
-                    "Benefit_type": "Cashback",
-                    "base_benefit_rate": 0.005,
-                    "applied_bonus_rate": 0.03,
-                    "total_calculated_value": 4.20
-                }
-            ]
-        }
-    """
-    source = "card_reasoner.explain"
+    # The LLM call is awaited on the event loop; the sync security-log write
+    # is handed to the threadpool so it does not block other requests.
     try:
-        response = generate_explanation(payload)
-        
-        # Optionally persist audit log (can be enhanced to write to database)
-        save_audit_log(response.audit_log_entry)
+        response = await generate_explanation_async(payload)
+        # Queued; the audit log file is written in batches in the background.
+        audit_log_buffer.put(response.audit_log_entry)
 
-        _safe_log_genai_event(
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="success",
             request=request,
             source=source,
             user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain",
+            endpoint=endpoint,
             details={
                 "category": payload.transaction.category,
                 "merchant_name": payload.transaction.merchant_name,
@@ -152,16 +116,16 @@ def explain_recommendation(
                 "is_fallback": bool(response.audit_log_entry.error),
             },
         )
-        
         return response
     except ValueError as e:
-        _safe_log_genai_event(
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="failed",
             request=request,
             source=source,
             user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain",
+            endpoint=endpoint,
             details={"reason": "validation_error"},
             error_message=str(e),
         )
@@ -176,13 +140,14 @@ def explain_recommendation(
             }
         )
     except Exception as e:
-        _safe_log_genai_event(
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="failed",
             request=request,
             source=source,
             user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain",
+            endpoint=endpoint,
             details={"reason": "genai_error"},
             error_message=str(e),
         )
@@ -198,6 +163,67 @@ def explain_recommendation(
         )
 
 
+@router.post("/explain", response_model=LegacyExplanationResponse)
+async def explain_recommendation(
+    payload: LegacyExplanationRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    user_id: int | None = Depends(get_x_user_id_int),
+) -> LegacyExplanationResponse:
+    """
+    Generate a natural language explanation for why a credit card was recommended.
+    
+    Args:
+        request: ExplanationRequest containing:
+            - transaction: Transaction details (merchant, amount, category)
+            - recommended_card: The recommended card with calculated value
+            - comparison_cards: Optional list of alternative cards considered
+    
+    Returns:
+        ExplanationResponse with:
+            - explanation: Natural language explanation for general users
+            - audit_log_entry: Audit trail entry for compliance/analytics
+    
+    Example:
+        POST /api/v1/card-reasoner/explain
+        {
+            "transaction": {
+                "merchant_name": "ZARA",
+                "amount": 120.00,
+                "category": "Fashion"
+            },
+            "recommended_card": {
+                "Card_ID": 3,
+                "Bank": "DBS",
+                "Card_Name": "DBS Live Fresh",
+                "Benefit_type": "Cashback",
+                "base_benefit_rate": 0.01,
+                "applied_bonus_rate": 0.035,
+                "total_calculated_value": 4.32
+            },
+            "comparison_cards": [
+                {
+                    "Card_ID": 5,
+                    "Bank": "OCBC",
+                    "Card_Name": "OCBC 365",
+                    "Benefit_type": "Cashback",
+                    "base_benefit_rate": 0.005,
+                    "applied_bonus_rate": 0.03,
+                    "total_calculated_value": 4.20
+                }
+            ]
+        }
+    """
+    return await _explain(
+        payload,
+        request,
+        db,
+        user_id,
+        source="card_reasoner.explain",
+        endpoint="/api/v1/card-reasoner/explain",
+    )
+
+
 @router.post("/explain-async", response_model=LegacyExplanationResponse)
 async def explain_recommendation_async(
     payload: LegacyExplanationRequest,
@@ -209,72 +235,17 @@ async def explain_recommendation_async(
     Async variant for non-blocking LLM calls.
     Recommended for high-concurrency scenarios.
     
-    Same request/response schema as /explain.
+    Same request/response schema as /explain, which now shares this
+    implementation; kept for existing clients.
     """
-    source = "card_reasoner.explain_async"
-    try:
-        response = await generate_explanation_async(payload)
-        save_audit_log(response.audit_log_entry)
-
-        _safe_log_genai_event(
-            db,
-            status="success",
-            request=request,
-            source=source,
-            user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain-async",
-            details={
-                "category": payload.transaction.category,
-                "merchant_name": payload.transaction.merchant_name,
-                "recommended_card_id": payload.recommended_card.Card_ID,
-                "comparison_count": len(payload.comparison_cards),
-                "model_used": response.audit_log_entry.model_used,
-                "is_fallback": bool(response.audit_log_entry.error),
-            },
-        )
-        return response
-    except ValueError as e:
-        _safe_log_genai_event(
-            db,
-            status="failed",
-            request=request,
-            source=source,
-            user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain-async",
-            details={"reason": "validation_error"},
-            error_message=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": f"Invalid input: {str(e)}",
-                    "details": {}
-                }
-            }
-        )
-    except Exception as e:
-        _safe_log_genai_event(
-            db,
-            status="failed",
-            request=request,
-            source=source,
-            user_id=user_id,
-            endpoint="/api/v1/card-reasoner/explain-async",
-            details={"reason": "genai_error"},
-            error_message=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "GENAI_ERROR",
-                    "message": "Failed to generate explanation",
-                    "details": {"error_type": type(e).__name__}
-                }
-            }
-        )
+    return await _explain(
+        payload,
+        request,
+        db,
+        user_id,
+        source="card_reasoner.explain_async",
+        endpoint="/api/v1/card-reasoner/explain-async",
+    )
 
 
 # =============================================================================
@@ -282,9 +253,10 @@ async def explain_recommendation_async(
 # =============================================================================
 
 @router.post("/explain-db", response_model=ExplanationResponse, status_code=status.HTTP_200_OK)
-def explain_from_database(
+async def explain_from_database(
     payload: ExplainFromDBRequest,
     request: Request,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     header_user_id: int | None = Depends(get_x_user_id_int),
 ) -> ExplanationResponse:
@@ -329,7 +301,8 @@ def explain_from_database(
         service = ExplanationService(db)
         
         # Build context from database (ground truth)
-        context = service.build_context_from_db(
+        context = await run_in_threadpool(
+            service.build_context_from_db,
             card_id=payload.card_id,
             category=payload.category,
             transaction_amount=payload.transaction_amount,
@@ -342,14 +315,15 @@ def explain_from_database(
             comparison_cards=[],
             user_id=payload.user_id
         )
-        response = service.generate_explanation(explanation_request)
+        response = await service.generate_explanation_async(explanation_request)
         
-        # Optional: Create audit log
+        # Audit log is written after the response is sent
         if payload.user_id:
             audit = service.create_audit_log(response, user_id=payload.user_id)
-            # TODO: Persist audit log to database or file
+            background.add_task(service.persist_audit_log, audit)
 
-        _safe_log_genai_event(
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="success",
             request=request,
@@ -368,7 +342,8 @@ def explain_from_database(
         return response
     
     except ValueError as e:
-        _safe_log_genai_event(
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="failed",
             request=request,
@@ -393,8 +368,11 @@ def explain_from_database(
                 }
             }
         )
-    except Exception as e:
-        _safe_log_genai_event(
+    except SQLAlchemyError as e:
+        # LLM failures never reach here (the service falls back to a template);
+        # anything other than a database error is left to the app-wide handler.
+        await run_in_threadpool(
+            _safe_log_genai_event,
             db,
             status="failed",
             request=request,
@@ -404,19 +382,127 @@ def explain_from_database(
             details={
                 "card_id": payload.card_id,
                 "category": payload.category,
-                "reason": "internal_error",
+                "reason": "database_error",
             },
             error_message=str(e),
         )
-        # Unexpected error
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": {
                     "code": "INTERNAL_ERROR",
                     "message": "Failed to generate explanation from database",
-                    "details": {"error_type": type(e).__name__, "error_message": str(e)}
+                    "details": {"error_type": type(e).__name__}
                 }
             }
         )
 
+
+
+async def _sse_events(
+    chunks: AsyncIterator[str],
+    log_outcome: Callable[[str, str | None], None],
+) -> AsyncIterator[str]:
+    # One SSE event per chunk; embedded newlines become extra `data:` lines.
+    # A stream cut off by the LLM ends with an `error` event instead of `done`,
+    # and the outcome is logged only once the stream has finished.
+    outcome, error_message = "failed", "stream ended before completion"
+    try:
+        async for chunk in chunks:
+            yield "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+    except ExplanationStreamInterrupted as e:
+        error_message = str(e)
+        yield "event: error\ndata: [INTERRUPTED]\n\n"
+    else:
+        outcome, error_message = "success", None
+        yield "event: done\ndata: [DONE]\n\n"
+    finally:
+        # Shielded so the log is still written when the client disconnects.
+        with anyio.CancelScope(shield=True):
+            await run_in_threadpool(log_outcome, outcome, error_message)
+
+
+@router.post("/explain-db/stream", status_code=status.HTTP_200_OK)
+async def explain_from_database_stream(
+    payload: ExplainFromDBRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    header_user_id: int | None = Depends(get_x_user_id_int),
+) -> StreamingResponse:
+    """
+    Streaming variant of /explain-db.
+
+    Same request body; the explanation is sent as Server-Sent Events
+    (`text/event-stream`) as the LLM produces it, followed by a final
+    `done` event, or an `error` event if the LLM stream breaks off after
+    text was sent. Unknown cards still return the JSON 404 error.
+    """
+    source = "card_reasoner.explain_db_stream"
+    endpoint = "/api/v1/card-reasoner/explain-db/stream"
+    user_id = payload.user_id if payload.user_id is not None else header_user_id
+    service = ExplanationService(db)
+    try:
+        context = await run_in_threadpool(
+            service.build_context_from_db,
+            card_id=payload.card_id,
+            category=payload.category,
+            transaction_amount=payload.transaction_amount,
+            merchant_name=payload.merchant_name
+        )
+    except ValueError as e:
+        await run_in_threadpool(
+            _safe_log_genai_event,
+            db,
+            status="failed",
+            request=request,
+            source=source,
+            user_id=user_id,
+            endpoint=endpoint,
+            details={
+                "card_id": payload.card_id,
+                "category": payload.category,
+                "reason": "not_found_or_invalid_input",
+            },
+            error_message=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": f"Card or bonus data not found: {str(e)}",
+                    "details": {"card_id": payload.card_id}
+                }
+            }
+        )
+
+    explanation_request = ExplanationRequest(
+        recommendation=context,
+        comparison_cards=[],
+        user_id=payload.user_id
+    )
+
+    def log_outcome(outcome: str, error_message: str | None) -> None:
+        # The request session is closed once streaming starts, so the event is
+        # written in a short-lived session of its own.
+        with Session(db.get_bind()) as log_db:
+            _safe_log_genai_event(
+                log_db,
+                status=outcome,
+                request=request,
+                source=source,
+                user_id=user_id,
+                endpoint=endpoint,
+                details={
+                    "card_id": payload.card_id,
+                    "category": payload.category,
+                    "streaming": True,
+                },
+                error_message=error_message,
+            )
+
+    return StreamingResponse(
+        _sse_events(service.stream_explanation(explanation_request), log_outcome),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
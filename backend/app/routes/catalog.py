@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.models.card_catalogue import CardCatalogueResponse, CardRewardUpdateRequest
 from app.services.catalog_service import CatalogService
@@ -10,9 +10,29 @@ router = APIRouter(
     tags=["catalog"]
 )
 
+# How long clients may reuse the catalog before revalidating with If-None-Match.
+CATALOG_CLIENT_MAX_AGE_SECONDS = 60
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 @router.get("/", response_model=list[CardCatalogueResponse])
-def get_catalog(service: CatalogService = Depends(get_catalog_service)):
-    return service.get_catalog()
+def get_catalog(request: Request, service: CatalogService = Depends(get_catalog_service)):
+    # response_model is kept for the OpenAPI schema; the body comes from the
+    # service's cached snapshot, and a matching If-None-Match gets a bare 304.
+    snapshot = service.get_catalog_snapshot()
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": f"max-age={CATALOG_CLIENT_MAX_AGE_SECONDS}",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.put("/{card_id}/rewards")
@@ -4,15 +4,21 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi import HTTPException, status
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from app.dependencies.db import get_db
+from app.dependencies.services import get_recommendation_service
 from app.dependencies.user_context import get_x_user_id
+from app.responses import AppJSONResponse
 from app.models.card_bonus_category import BonusCategory
-from app.services.recommendation_service import RecommendationService
+from app.services.recommendation_service import (
+    CardRecommendationDTO,
+    RecommendationService,
+    RecommendResult,
+)
 from app.services.explanation_service import ExplanationService
 from app.schemas.ai_schemas import ExplanationRequest, ExplanationResponse
 from app.services.security_log_service import log_genai_access_event
@@ -95,29 +101,19 @@ class RecommendationExplainResponse(RecommendationResponse):
 def _resolve_user_id(user_id: Optional[int], x_user_id: Optional[str]) -> int:
     if user_id is not None:
         return user_id
-    if x_user_id and x_user_id.isdigit():
+    if x_user_id and x_user_id.isdecimal():
         return int(x_user_id)
     raise ValueError("user_id is required (query param) or x-user-id header must be an integer")
 
 
-@router.get("/recommendation", response_model=RecommendationResponse)
-def get_recommendation(
-    request: Request,
-    db: Session = Depends(get_db),
+def _require_recommendation_user_id(
     x_user_id: Optional[str] = Depends(get_x_user_id),
     user_id: Optional[int] = Query(default=None),
-    category: Optional[BonusCategory] = Query(default=None),
-    amount_sgd: Optional[Decimal] = Query(default=None),
-    preference: Optional[RewardPreference] = Query(default=None),
-):
-    """Recommend the best owned card for a given spend context.
-
-    Must-have behavior:
-    - Queries active user cards from DB.
-    - Queries reward rules (bonus categories) from DB.
-    """
+) -> int:
+    # Declared ahead of get_db so a request without a usable user id is
+    # rejected before a session is opened.
     try:
-        resolved_user_id = _resolve_user_id(user_id, x_user_id)
+        return _resolve_user_id(user_id, x_user_id)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -130,6 +126,78 @@ def get_recommendation(
             },
         )
 
+
+def _card_from_dto(dto: CardRecommendationDTO) -> dict[str, Any]:
+    # Plain dict in the RecommendationCard shape; the DTO already holds typed
+    # values, so the route encodes it directly instead of through the model.
+    # Reward amounts and rates are Decimal in the DTO: whole numbers for
+    # miles, floats for cashback.
+    to_number = int if dto.reward_unit == "miles" else float
+    breakdown = dto.reward_breakdown
+    return {
+        "card_id": dto.card_id,
+        "card_name": dto.card_name,
+        "base_benefit_rate": float(dto.base_benefit_rate),
+        "effective_benefit_rate": float(dto.effective_benefit_rate),
+        "applied_bonus_category": dto.applied_bonus_category,
+        "bonus_rules": [
+            {
+                "bonus_category": r.bonus_category,
+                "bonus_benefit_rate": to_number(r.bonus_benefit_rate),
+                "bonus_cap_in_dollar": r.bonus_cap_in_dollar,
+                "bonus_minimum_spend_in_dollar": r.bonus_minimum_spend_in_dollar,
+            }
+            for r in dto.bonus_rules
+        ],
+        "min_spend_required_sgd": dto.min_spend_required_sgd,
+        "current_cycle_spend_sgd": float(dto.current_cycle_spend_sgd),
+
+        "reward_unit": dto.reward_unit,
+        "estimated_reward_value": to_number(dto.estimated_reward_value),
+        "effective_rate_str": dto.effective_rate_str,
+        "explanations": dto.explanations,
+        "reward_breakdown": {
+            "amount_sgd": float(breakdown.amount_sgd),
+            "reward_unit": breakdown.reward_unit,
+            "base_rate": to_number(breakdown.base_rate),
+            "effective_rate": to_number(breakdown.effective_rate),
+            "rate_source": breakdown.rate_source,
+            "applied_bonus_category": breakdown.applied_bonus_category,
+            "min_spend_required_sgd": breakdown.min_spend_required_sgd,
+            "min_spend_met": breakdown.min_spend_met,
+            "cap_in_dollar": breakdown.cap_in_dollar,
+            "reward_before_cap": to_number(breakdown.reward_before_cap),
+            "reward_after_cap": to_number(breakdown.reward_after_cap),
+            "cap_applied": breakdown.cap_applied,
+        },
+    }
+
+
+def _encode_recommendation(result: RecommendResult) -> bytes:
+    best, ranked = result
+    return AppJSONResponse(
+        {
+            "recommended": _card_from_dto(best) if best else None,
+            "ranked_cards": [_card_from_dto(c) for c in ranked],
+        }
+    ).body
+
+
+@router.get("/recommendation", response_model=RecommendationResponse)
+def get_recommendation(
+    request: Request,
+    resolved_user_id: int = Depends(_require_recommendation_user_id),
+    service: RecommendationService = Depends(get_recommendation_service),
+    category: Optional[BonusCategory] = Query(default=None),
+    amount_sgd: Optional[Decimal] = Query(default=None),
+    preference: Optional[RewardPreference] = Query(default=None),
+):
+    """Recommend the best owned card for a given spend context.
+
+    Must-have behavior:
+    - Queries active user cards from DB.
+    - Queries reward rules (bonus categories) from DB.
+    """
     # Allow amount_sgd=0 (frontend may omit spend context by sending 0).
     # Negative amounts are invalid.
     if amount_sgd is not None and amount_sgd < 0:
@@ -144,8 +212,10 @@ def get_recommendation(
             },
         )
 
-    service = RecommendationService(db)
-    best, ranked = service.recommend(
+    # The encoded body is cached alongside the result, so repeat requests skip
+    # encoding as well as SQL.
+    (_, ranked), body = service.recommend_cached_encoded(
+        _encode_recommendation,
         user_id=resolved_user_id,
         category=category,
         amount_sgd=amount_sgd,
@@ -163,57 +233,9 @@ def get_recommendation(
             },
         )
 
-    def as_json_number(value: Any, *, reward_unit: str) -> Any:
-        if isinstance(value, Decimal):
-            if reward_unit == "miles":
-                return int(value)
-            return float(value)
-        return value
-
-    def to_model(dto):
-        unit = dto.reward_unit
-        return RecommendationCard(
-            card_id=dto.card_id,
-            card_name=dto.card_name,
-            base_benefit_rate=float(dto.base_benefit_rate),
-            effective_benefit_rate=float(dto.effective_benefit_rate),
-            applied_bonus_category=dto.applied_bonus_category,
-            bonus_rules=[
-                {
-                    "bonus_category": r.bonus_category,
-                    "bonus_benefit_rate": as_json_number(r.bonus_benefit_rate, reward_unit=unit),
-                    "bonus_cap_in_dollar": r.bonus_cap_in_dollar,
-                    "bonus_minimum_spend_in_dollar": r.bonus_minimum_spend_in_dollar,
-                }
-                for r in dto.bonus_rules
-            ],
-            min_spend_required_sgd=dto.min_spend_required_sgd,
-            current_cycle_spend_sgd=float(dto.current_cycle_spend_sgd),
-
-            reward_unit=dto.reward_unit,
-            estimated_reward_value=as_json_number(dto.estimated_reward_value, reward_unit=unit),
-            effective_rate_str=dto.effective_rate_str,
-            explanations=dto.explanations,
-            reward_breakdown={
-                "amount_sgd": float(dto.reward_breakdown.amount_sgd),
-                "reward_unit": dto.reward_breakdown.reward_unit,
-                "base_rate": as_json_number(dto.reward_breakdown.base_rate, reward_unit=unit),
-                "effective_rate": as_json_number(dto.reward_breakdown.effective_rate, reward_unit=unit),
-                "rate_source": dto.reward_breakdown.rate_source,
-                "applied_bonus_category": dto.reward_breakdown.applied_bonus_category,
-                "min_spend_required_sgd": dto.reward_breakdown.min_spend_required_sgd,
-                "min_spend_met": dto.reward_breakdown.min_spend_met,
-                "cap_in_dollar": dto.reward_breakdown.cap_in_dollar,
-                "reward_before_cap": as_json_number(dto.reward_breakdown.reward_before_cap, reward_unit=unit),
-                "reward_after_cap": as_json_number(dto.reward_breakdown.reward_after_cap, reward_unit=unit),
-                "cap_applied": dto.reward_breakdown.cap_applied,
-            },
-        )
-
-    return RecommendationResponse(
-        recommended=to_model(best) if best else None,
-        ranked_cards=[to_model(c) for c in ranked],
-    )
+    # response_model is kept for the OpenAPI schema; returning the response
+    # directly skips FastAPI's model validation and encoding pass.
+    return Response(content=body, media_type="application/json")
 
 @router.post("/recommendation/explain", response_model=ExplanationResponse)
 def recommend_and_explain(
@@ -273,7 +295,7 @@ def recommend_and_explain(
 
     rec_service = RecommendationService(db)
     try:
-        best, ranked = rec_service.recommend(
+        best, ranked = rec_service.recommend_cached(
             user_id=resolved_user_id,
             category=payload.category,
             amount_sgd=payload.amount_sgd,
@@ -311,74 +333,17 @@ def recommend_and_explain(
             },
         )
 
-    def as_json_number(value: Any, *, reward_unit: str) -> Any:
-        if isinstance(value, Decimal):
-            if reward_unit == "miles":
-                return int(value)
-            return float(value)
-        return value
-
-    def to_model(dto):
-        unit = dto.reward_unit
-        return RecommendationCard(
-            card_id=dto.card_id,
-            card_name=dto.card_name,
-            base_benefit_rate=float(dto.base_benefit_rate),
-            effective_benefit_rate=float(dto.effective_benefit_rate),
-            applied_bonus_category=dto.applied_bonus_category,
-            bonus_rules=[
-                {
-                    "bonus_category": r.bonus_category,
-                    "bonus_benefit_rate": as_json_number(r.bonus_benefit_rate, reward_unit=unit),
-                    "bonus_cap_in_dollar": r.bonus_cap_in_dollar,
-                    "bonus_minimum_spend_in_dollar": r.bonus_minimum_spend_in_dollar,
-                }
-                for r in dto.bonus_rules
-            ],
-            min_spend_required_sgd=dto.min_spend_required_sgd,
-            current_cycle_spend_sgd=float(dto.current_cycle_spend_sgd),
-            reward_unit=dto.reward_unit,
-            estimated_reward_value=as_json_number(dto.estimated_reward_value, reward_unit=unit),
-            effective_rate_str=dto.effective_rate_str,
-            explanations=dto.explanations,
-            reward_breakdown={
-                "amount_sgd": float(dto.reward_breakdown.amount_sgd),
-                "reward_unit": dto.reward_breakdown.reward_unit,
-                "base_rate": as_json_number(dto.reward_breakdown.base_rate, reward_unit=unit),
-                "effective_rate": as_json_number(dto.reward_breakdown.effective_rate, reward_unit=unit),
-                "rate_source": dto.reward_breakdown.rate_source,
-                "applied_bonus_category": dto.reward_breakdown.applied_bonus_category,
-                "min_spend_required_sgd": dto.reward_breakdown.min_spend_required_sgd,
-                "min_spend_met": dto.reward_breakdown.min_spend_met,
-                "cap_in_dollar": dto.reward_breakdown.cap_in_dollar,
-                "reward_before_cap": as_json_number(dto.reward_breakdown.reward_before_cap, reward_unit=unit),
-                "reward_after_cap": as_json_number(dto.reward_breakdown.reward_after_cap, reward_unit=unit),
-                "cap_applied": dto.reward_breakdown.cap_applied,
-            },
-        )
-
     # ExplanationService expects category string matching BonusCategory enum member name
     category_str = (payload.category.name if payload.category is not None else "All")
 
     exp_service = ExplanationService(db)
-    primary_ctx = exp_service.build_context_from_db(
-        card_id=best.card_id,
+    primary_ctx, *comparison_ctxs = exp_service.build_contexts_from_db(
+        card_ids=[best.card_id] + [alt.card_id for alt in ranked[1:3]],
         category=category_str,
         transaction_amount=payload.amount_sgd,
         merchant_name=payload.merchant_name,
     )
 
-    comparison_ctxs = []
-    for alt in ranked[1:3]:
-        comparison_ctxs.append(
-            exp_service.build_context_from_db(
-                card_id=alt.card_id,
-                category=category_str,
-                transaction_amount=payload.amount_sgd,
-                merchant_name=payload.merchant_name,
-            )
-        )
-
     exp_request = ExplanationRequest(recommendation=primary_ctx, comparison_cards=comparison_ctxs)
     try:
         explanation = exp_service.generate_explanation(exp_request)
@@ -414,4 +379,6 @@ def recommend_and_explain(
         },
     )
 
-    return explanation
\ No newline at end of file
+    # As with /recommendation, response_model only documents the schema;
+    # pydantic-core encodes the model straight to JSON bytes.
+    return Response(content=explanation.model_dump_json(), media_type="application/json")
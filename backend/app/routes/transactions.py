@@ -1,19 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
-from typing import Dict, Any, Optional
+from fastapi.routing import APIRoute
+from typing import Callable, Coroutine, Dict, Any, Optional
 from pydantic import BaseModel
 
-from sqlalchemy.orm import Session
-
-from app.dependencies.db import get_db
-from app.dependencies.user_context import get_x_user_id
-from app.models.transaction import TransactionRequest, TransactionUpdate, TransactionStatus
+from app.dependencies.services import get_transaction_service
+from app.dependencies.user_context import require_x_user_id
+from app.models.transaction import TransactionBatchRequest, TransactionRequest, TransactionUpdate, TransactionStatus
+from app.responses import AppJSONResponse
 from app.services.errors import ServiceError
 from app.services.transaction_service import TransactionService
 
+
+class _UserContextRoute(APIRoute):
+    """Route that renders a ServiceError raised by a dependency in the API error shape.
+
+    `require_x_user_id` rejects unauthenticated calls before the request body
+    is validated; this keeps its 401 body identical to the route-level errors
+    without relying on an app-wide exception handler.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except ServiceError as exc:
+                return JSONResponse(
+                    status_code=exc.status_code,
+                    content={
+                        "error": {
+                            "code": exc.code,
+                            "message": exc.message,
+                            "details": exc.details,
+                        }
+                    },
+                )
+
+        return route_handler
+
+
 router = APIRouter(
     prefix="/api/v1/transactions",
-    tags=["transactions"]
+    tags=["transactions"],
+    route_class=_UserContextRoute,
 )
 
 
@@ -33,19 +64,6 @@ class TransactionUpdateRequest(BaseModel):
     transaction: TransactionUpdate
 
 
-def _unauthorized_response() -> JSONResponse:
-    return JSONResponse(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        content={
-            "error": {
-                "code": "UNAUTHORIZED",
-                "message": "Missing or invalid user context.",
-                "details": {"required_header": "x-user-id"},
-            }
-        },
-    )
-
-
 def _forbidden_response() -> JSONResponse:
     return JSONResponse(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -71,14 +89,15 @@ def _list_transactions_for_user(
     target_user_id: str,
     requester_user_id: str,
     sort: str,
-    db: Session,
+    service: TransactionService,
 ) -> Dict[str, Any] | JSONResponse:
-    service = TransactionService(db)
-    if service._resolve_user_id(requester_user_id) != service._resolve_user_id(target_user_id):
+    # Resolve each id once; username ids cost a profile lookup.
+    resolved_target_id = service._resolve_user_id(target_user_id)
+    if service._resolve_user_id(requester_user_id) != resolved_target_id:
         return _forbidden_response()
 
     transactions = service.get_user_transactions(
-        target_user_id,
+        resolved_target_id,
         sort_by_date_desc=_parse_sort_to_desc(sort),
     )
     return {"transactions": transactions}
@@ -87,8 +106,8 @@ def _list_transactions_for_user(
 @router.post("", status_code=201)
 def create_transaction(
     request: TransactionRequest,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Create a new transaction.
@@ -106,11 +125,7 @@ def create_transaction(
         }
     }
     """
-    if not user_id:
-        return _unauthorized_response()
-    
     try:
-        service = TransactionService(db)
         transaction = service.create_transaction(user_id, request.transaction)
         return {"transaction": transaction}
     except ServiceError as exc:
@@ -137,20 +152,63 @@ def create_transaction(
         )
 
 
+@router.post("/batch", status_code=201)
+def create_transactions_batch(
+    request: TransactionBatchRequest,
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
+) -> Dict[str, Any]:
+    """
+    Create several transactions in one request (e.g. a basket of items).
+
+    Request body:
+    {
+        "transactions": [
+            {"card_id": 1, "amount_sgd": 12.50, "item": "GrabFood", "channel": "online"},
+            {"card_id": 1, "amount_sgd": 4.20, "item": "Kopi", "channel": "offline"}
+        ]
+    }
+
+    Returns the created transactions in request order. All rows are written
+    with one multi-row INSERT; if any card is not in the wallet nothing is saved.
+    """
+    try:
+        transactions = service.create_many(user_id, request.transactions)
+        return {"transactions": transactions}
+    except ServiceError as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "details": exc.details,
+                }
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "code": "INTERNAL_ERROR",
+                    "message": "Internal server error.",
+                    "details": {}
+                }
+            }
+        )
+
+
 @router.get("")
 def list_transactions(
     request: Request,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     List all transactions for current user.
     """
-    if not user_id:
-        return _unauthorized_response()
-    
     try:
-        service = TransactionService(db)
         transactions = service.get_user_transactions(user_id, sort_by_date_desc=True)
         return {"transactions": transactions}
     except ServiceError as exc:
@@ -171,8 +229,8 @@ def get_user_transactions_by_id(
     user_id: str,
     request: Request,
     sort: str = "date_desc",
-    db: Session = Depends(get_db),
-    header_user_id: Optional[str] = Depends(get_x_user_id),
+    header_user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Get all transactions for a specific user.
@@ -189,15 +247,12 @@ def get_user_transactions_by_id(
     Security:
     - Only returns transactions for the specified user
     """
-    if not header_user_id:
-        return _unauthorized_response()
-
     try:
         return _list_transactions_for_user(
             target_user_id=user_id,
             requester_user_id=header_user_id,
             sort=sort,
-            db=db,
+            service=service,
         )
     except ServiceError as exc:
         raise HTTPException(
@@ -217,22 +272,19 @@ def list_transactions_by_user_id(
     user_id: str,
     request: Request,
     sort: str = "date_desc",
-    db: Session = Depends(get_db),
-    header_user_id: Optional[str] = Depends(get_x_user_id),
+    header_user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """List all transactions for the specified user_id.
 
     Requires x-user-id header and only allows requesting your own transactions.
     """
-    if not header_user_id:
-        return _unauthorized_response()
-
     try:
         return _list_transactions_for_user(
             target_user_id=user_id,
             requester_user_id=header_user_id,
             sort=sort,
-            db=db,
+            service=service,
         )
     except ServiceError as exc:
         raise HTTPException(
@@ -251,8 +303,8 @@ def list_transactions_by_user_id(
 def update_transaction(
     transaction_id: int,
     request: TransactionUpdateRequest | TransactionStatusUpdate,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Update a transaction's fields (item, amount, category, etc.).
@@ -272,12 +324,7 @@ def update_transaction(
         }
     }
     """
-    if not user_id:
-        return _unauthorized_response()
-    
     try:
-        service = TransactionService(db)
-
         # Backward-compatible: some clients/tests send only {"status": "..."}
         # to this endpoint instead of the newer {"transaction": {...}} wrapper.
         if isinstance(request, TransactionStatusUpdate):
@@ -315,8 +362,8 @@ def update_transaction(
 def bulk_update_transaction_status(
     bulk_update: BulkTransactionStatusUpdate,
     http_request: Request,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Bulk update multiple transactions' status.
@@ -330,13 +377,11 @@ def bulk_update_transaction_status(
     Returns:
     - count: Number of transactions updated
     """
-    if not user_id:
-        return _unauthorized_response()
-    
     try:
-        service = TransactionService(db)
         count = service.bulk_update_transaction_status(user_id, bulk_update.transaction_ids, bulk_update.status)
-        return {"count": count, "status": bulk_update.status}
+        # Returned as a response so FastAPI skips validating and re-encoding
+        # this fixed two-field body against the Dict return annotation.
+        return AppJSONResponse({"count": count, "status": bulk_update.status})
     except ServiceError as exc:
         raise HTTPException(
             status_code=exc.status_code,
@@ -366,8 +411,8 @@ def update_transaction_status(
     transaction_id: int,
     status_update: TransactionStatusUpdate,
     http_request: Request,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Update only a transaction's status (e.g., mark as deleted_with_card).
@@ -380,11 +425,7 @@ def update_transaction_status(
         "status": "deleted_with_card"
     }
     """
-    if not user_id:
-        return _unauthorized_response()
-
     try:
-        service = TransactionService(db)
         transaction = service.update_transaction_status(user_id, transaction_id, status_update.status)
         return {"transaction": transaction}
     except ServiceError as exc:
@@ -415,8 +456,8 @@ def update_transaction_status(
 def delete_transaction(
     transaction_id: int,
     http_request: Request,
-    db: Session = Depends(get_db),
-    user_id: Optional[str] = Depends(get_x_user_id),
+    user_id: str = Depends(require_x_user_id),
+    service: TransactionService = Depends(get_transaction_service),
 ) -> Dict[str, Any]:
     """
     Delete a transaction that was mistakenly added.
@@ -427,11 +468,7 @@ def delete_transaction(
     Returns:
     - The deleted transaction object
     """
-    if not user_id:
-        return _unauthorized_response()
-    
     try:
-        service = TransactionService(db)
         deleted_transaction = service.delete_transaction(user_id, transaction_id)
         return {"transaction": deleted_transaction}
     except ServiceError as exc:
@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.dependencies.services import get_user_card_management_service
 from app.models.user_owned_cards import (
+    WALLET_LIST_ADAPTER,
     UserOwnedCardCreate,
     UserOwnedCardResponse,
     UserOwnedCardUpdate,
@@ -81,10 +82,15 @@ def get_user_cards(
     Get all cards owned by the authenticated user.
     """
     try:
-        return service.get_user_cards(cognito_sub)
+        cards = service.get_user_cards(cognito_sub)
     except (ServiceException, ServiceError) as exc:
         logger.error("Error fetching user cards: %s", exc)
         _raise_http_from_service_exception(exc)
+
+    # response_model is kept for the OpenAPI schema; the body is encoded by the
+    # prebuilt list adapter instead of FastAPI's per-request serialization.
+    wallet = WALLET_LIST_ADAPTER.validate_python(cards, from_attributes=True)
+    return Response(content=WALLET_LIST_ADAPTER.dump_json(wallet), media_type="application/json")
     
 
 @router.post("", response_model=UserOwnedCardResponse, status_code=status.HTTP_201_CREATED)
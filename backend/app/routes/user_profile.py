@@ -18,7 +18,9 @@ cognito_service = CognitoService()
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def _get_cognito_sub(auth: HTTPAuthorizationCredentials) -> str:
+def _get_cognito_sub(auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> str:
+    # Resolved as a dependency ahead of the service so a rejected token stops
+    # the request before a DB session or service instance is created.
     if not auth:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing Authorization header.")
 
@@ -30,18 +32,16 @@ def _get_cognito_sub(auth: HTTPAuthorizationCredentials) -> str:
 
 @router.get("/", response_model=list[UserProfileResponse])
 def get_user_profiles(
-    auth: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    cognito_sub: str = Depends(_get_cognito_sub),
     service: UserProfileService = Depends(get_user_profile_service),
 ):
-    _get_cognito_sub(auth)
     return service.get_all_user_profiles()
 
 @router.get("/me", response_model=UserProfileResponse)
 def get_my_profile(
-    auth: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    cognito_sub: str = Depends(_get_cognito_sub),
     service: UserProfileService = Depends(get_user_profile_service),
 ):
-    cognito_sub = _get_cognito_sub(auth)
 
     profile = service.get_user_profile(cognito_sub)
     if not profile:
@@ -51,10 +51,9 @@ def get_my_profile(
 @router.put("/me", response_model=UserProfileResponse)
 def update_my_profile(
     update: UserProfileUpdate,
-    auth: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    cognito_sub: str = Depends(_get_cognito_sub),
     service: UserProfileService = Depends(get_user_profile_service),
 ):
-    cognito_sub = _get_cognito_sub(auth)
 
     try:
         updated_profile = service.update_user_profile(
@@ -14,6 +14,7 @@ import os
 import json
 import logging
 import asyncio
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -398,6 +399,22 @@ def save_audit_log(audit_entry: AuditLogEntry, custom_path: Optional[str] = None
     Returns:
         True if successful, False otherwise
     """
+    return save_audit_logs([audit_entry], custom_path)
+
+
+def save_audit_logs(audit_entries: List[AuditLogEntry], custom_path: Optional[str] = None) -> bool:
+    """
+    Append several audit log entries to the JSON log file in one write.
+
+    Args:
+        audit_entries: AuditLogEntry objects to save, in order
+        custom_path: Optional custom path for log file (should be absolute path)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not audit_entries:
+        return True
     try:
         # Use absolute path to prevent path traversal vulnerabilities
         if custom_path:
@@ -435,14 +452,14 @@ def save_audit_log(audit_entry: AuditLogEntry, custom_path: Optional[str] = None
                 with open(log_file, "r") as f:
                     logs = json.load(f)
             
-            # Append new entry
-            logs.append(audit_entry.model_dump())
+            # Append new entries
+            logs.extend(entry.model_dump() for entry in audit_entries)
             
             # Write updated logs
             with open(log_file, "w") as f:
                 json.dump(logs, f, indent=2, default=str)
             
-            logger.debug(f"Audit log saved: {audit_entry.event_type} for {audit_entry.recommended_card_name}")
+            logger.debug(f"Audit log saved: {len(audit_entries)} entries")
             return True
         finally:
             # Remove lock file
@@ -454,3 +471,77 @@ def save_audit_log(audit_entry: AuditLogEntry, custom_path: Optional[str] = None
     except Exception as e:
         logger.exception(f"Failed to save audit log to {custom_path}: {e}")
         return False
+
+
+class AuditLogBuffer:
+    """
+    Collects audit log entries from request handlers and writes them in batches.
+
+    Each write rewrites the whole JSON log file, so doing it once per batch
+    instead of once per request keeps it off the explanation latency path.
+    While the background flusher is not running (e.g. no app lifespan),
+    entries are written immediately, as before.
+    """
+
+    def __init__(self, flush_interval_seconds: float = 0.5, max_batch_size: int = 200):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self._entries: List[AuditLogEntry] = []
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def put(self, audit_entry: AuditLogEntry) -> None:
+        """Queue an entry without blocking; safe to call from worker threads."""
+        if not self.running:
+            save_audit_log(audit_entry)
+            return
+        with self._lock:
+            self._entries.append(audit_entry)
+            full = len(self._entries) >= self.max_batch_size
+        if full:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        with self._lock:
+            batch, self._entries = self._entries, []
+        if batch:
+            await asyncio.to_thread(save_audit_logs, batch)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush audit log buffer")
+
+
+audit_log_buffer = AuditLogBuffer()
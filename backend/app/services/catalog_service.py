@@ -1,13 +1,48 @@
+import hashlib
+import time
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.card_bonus_category import CardBonusCategory
-from app.models.card_catalogue import CardCatalogue, CardRewardUpdatePayload
+from app.models.card_catalogue import CATALOG_LIST_ADAPTER, CardCatalogue, CardRewardUpdatePayload
 from app.models.card_change_notification import CardChangeNotification
 from app.models.user_owned_cards import UserOwnedCard
 from app.services.errors import ServiceError
+from app.services.recommendation_service import invalidate_recommendations
+
+# The catalog changes rarely, so its serialized form is kept in-process and
+# rebuilt at most once per TTL (or right after a reward update in this process).
+CATALOG_CACHE_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    body: bytes
+    etag: str
+
+
+_catalog_cache: Optional[Tuple[float, CatalogSnapshot]] = None
+
+# Just the CardCatalogueResponse fields, as plain rows: the snapshot is built
+# without ORM instances, identity-map bookkeeping or relationship setup.
+STMT_CATALOG_ROWS = select(
+    CardCatalogue.card_id,
+    CardCatalogue.bank,
+    CardCatalogue.card_name,
+    CardCatalogue.benefit_type,
+    CardCatalogue.base_benefit_rate,
+    CardCatalogue.status,
+)
+
+
+def invalidate_catalog_cache() -> None:
+    global _catalog_cache
+    _catalog_cache = None
+
 
 class CatalogService:
     def __init__(self, db: Session):
@@ -17,6 +52,24 @@ class CatalogService:
         """Retrieve all cards from the database."""
         return self.db.query(CardCatalogue).all()
 
+    def get_catalog_snapshot(self) -> CatalogSnapshot:
+        """Return the catalog as JSON bytes plus an ETag, cached for CATALOG_CACHE_TTL_SECONDS."""
+        global _catalog_cache
+        now = time.monotonic()
+        cached = _catalog_cache
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        rows = self.db.execute(STMT_CATALOG_ROWS).all()
+        cards = CATALOG_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        body = CATALOG_LIST_ADAPTER.dump_json(cards)
+        snapshot = CatalogSnapshot(
+            body=body,
+            etag=f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"',
+        )
+        _catalog_cache = (now + CATALOG_CACHE_TTL_SECONDS, snapshot)
+        return snapshot
+
     def _decimal_to_string(self, value: Any) -> str:
         dec = Decimal(str(value))
         text = format(dec, "f")
@@ -153,6 +206,8 @@ class CatalogService:
                 notifications_created += 1
 
         self.db.commit()
+        invalidate_catalog_cache()
+        invalidate_recommendations()
         return {
             "card_id": card.card_id,
             "card_name": card.card_name,
@@ -1,5 +1,6 @@
 import json
 import os
+import tempfile
 from datetime import date
 from typing import List, Dict, Any
 import uuid
@@ -22,9 +23,15 @@ def _load_json(file_path: str) -> Dict[str, Any]:
 
 
 def _save_json(file_path: str, data: Dict[str, Any]) -> None:
-    """Save data to JSON file"""
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save data to JSON file atomically (write a temp file, then rename)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def get_user_wallet(user_id: str = "u_001") -> List[Dict[str, Any]]:
@@ -98,7 +105,7 @@ def get_transaction_by_id(transaction_id: str, user_id: str = "u_001") -> Dict[s
 
 
 def init_sample_data() -> None:
-    """Initialize sample user data"""
+    """Initialize sample user data (idempotent; safe to run on every startup)"""
     sample_user = {
         "user_id": "u_001",
         "username": "demo",
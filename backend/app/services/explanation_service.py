@@ -13,16 +13,19 @@ Architectural Decisions:
 - Type-safe: Uses Pydantic schemas throughout
 """
 
+import asyncio
 import os
+import threading
 import time
 import logging
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List
 
 from sqlalchemy.orm import Session
-from openai import OpenAI, APIError, APITimeoutError
+from openai import AsyncOpenAI, AsyncStream, OpenAI, APIError, APITimeoutError
 
 from app.models.card_catalogue import CardCatalogue
 from app.models.card_bonus_category import CardBonusCategory, BonusCategory
@@ -35,6 +38,7 @@ from app.schemas.ai_schemas import (
 )
 
 from app.services.datetime_utils import utc_now
+from app.services.security_log_service import SecurityEventType, log_security_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -91,9 +95,132 @@ class LLMConfig:
             _default_max_retries,
         )
         MAX_RETRIES = _default_max_retries
+
+    # Hard wall-clock limit for one async LLM call, retries included. The
+    # client's own timeout applies per attempt between bytes, so a slowly
+    # trickling response could otherwise hold the request far longer.
+    _default_request_timeout = 15
+    try:
+        REQUEST_TIMEOUT_SECONDS = float(
+            os.getenv("LLM_REQUEST_TIMEOUT", str(_default_request_timeout))
+        )
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid LLM_REQUEST_TIMEOUT value; falling back to default %s seconds",
+            _default_request_timeout,
+        )
+        REQUEST_TIMEOUT_SECONDS = float(_default_request_timeout)
+
+    # Streaming: deltas are coalesced into batches that start at one delta and
+    # grow by STREAM_BATCH_SIZE_GROWTH_FACTOR up to STREAM_MAX_BATCH_SIZE; a
+    # partial batch is flushed after STREAM_FLUSH_INTERVAL_MS.
+    _default_stream_max_batch_size = 50
+    try:
+        STREAM_MAX_BATCH_SIZE = int(
+            os.getenv("LLM_STREAM_MAX_BATCH_SIZE", str(_default_stream_max_batch_size))
+        )
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid LLM_STREAM_MAX_BATCH_SIZE value; falling back to default %s",
+            _default_stream_max_batch_size,
+        )
+        STREAM_MAX_BATCH_SIZE = _default_stream_max_batch_size
+
+    _default_stream_growth_factor = 3.0
+    try:
+        STREAM_BATCH_SIZE_GROWTH_FACTOR = float(
+            os.getenv("LLM_STREAM_BATCH_SIZE_GROWTH_FACTOR", str(_default_stream_growth_factor))
+        )
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid LLM_STREAM_BATCH_SIZE_GROWTH_FACTOR value; falling back to default %s",
+            _default_stream_growth_factor,
+        )
+        STREAM_BATCH_SIZE_GROWTH_FACTOR = _default_stream_growth_factor
+
+    _default_stream_flush_interval_ms = 50
+    try:
+        STREAM_FLUSH_INTERVAL_MS = int(
+            os.getenv("LLM_STREAM_FLUSH_INTERVAL_MS", str(_default_stream_flush_interval_ms))
+        )
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid LLM_STREAM_FLUSH_INTERVAL_MS value; falling back to default %s",
+            _default_stream_flush_interval_ms,
+        )
+        STREAM_FLUSH_INTERVAL_MS = _default_stream_flush_interval_ms
+
+
+class ExplanationStreamInterrupted(Exception):
+    """The LLM stream failed after part of the explanation was already sent."""
+
+
+async def batch_stream(
+    chunks: AsyncIterator[str],
+    *,
+    max_batch_size: int,
+    growth_factor: float,
+    flush_interval_ms: int,
+) -> AsyncIterator[str]:
+    """
+    Coalesce streamed text chunks into fewer, larger chunks.
+
+    The first batch is a single chunk so the first token is not delayed;
+    each later batch is `growth_factor` times larger, up to `max_batch_size`.
+    A partial batch is flushed once it has waited `flush_interval_ms`.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        finally:
+            await queue.put(end)
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    flush_interval = max(flush_interval_ms, 0) / 1000
+    batch_size = 1
+    buffer: list[str] = []
+    deadline = 0.0
+    try:
+        while True:
+            if buffer:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    item = None
+            else:
+                item = await queue.get()
+
+            if item is end:
+                break
+            if item is not None:
+                if not buffer:
+                    deadline = loop.time() + flush_interval
+                buffer.append(item)
+                if len(buffer) < batch_size and loop.time() < deadline:
+                    continue
+
+            yield "".join(buffer)
+            buffer = []
+            batch_size = min(max(int(batch_size * growth_factor), 1), max(max_batch_size, 1))
+
+        if buffer:
+            yield "".join(buffer)
+        # Surfaces any error raised by the underlying stream.
+        await producer
+    finally:
+        producer.cancel()
+
+
 # Initialize OpenAI client (only if API key present)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 openai_client = None
+# Used by the async endpoints so the LLM round-trip is awaited, not run on a worker thread.
+async_openai_client = None
 
 if OPENAI_API_KEY:
     try:
@@ -102,6 +229,11 @@ if OPENAI_API_KEY:
             timeout=float(LLMConfig.TIMEOUT_SECONDS),
             max_retries=LLMConfig.MAX_RETRIES
         )
+        async_openai_client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            timeout=float(LLMConfig.TIMEOUT_SECONDS),
+            max_retries=LLMConfig.MAX_RETRIES
+        )
         logger.info(f"OpenAI client initialized with model: {LLMConfig.MODEL}")
     except Exception as e:
         logger.warning(f"Failed to initialize OpenAI client: {e}. Will use fallback mode.")
@@ -112,6 +244,67 @@ else:
     )
 
 
+# LLM explanations keyed by prompt. The prompt carries every ground-truth
+# figure (card, rates, cap, amount, total reward), so an identical prompt can
+# reuse an earlier answer. Only successful LLM responses are stored.
+EXPLANATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+EXPLANATION_CACHE_MAX_ENTRIES = 1024
+
+_explanation_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_explanation_cache_lock = threading.Lock()
+
+
+def _explanation_cache_key(prompt: str) -> str:
+    return hashlib.blake2b(f"{LLMConfig.MODEL}|{prompt}".encode(), digest_size=16).hexdigest()
+
+
+def get_cached_explanation(prompt: str) -> Optional[str]:
+    key = _explanation_cache_key(prompt)
+    with _explanation_cache_lock:
+        cached = _explanation_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del _explanation_cache[key]
+            return None
+        _explanation_cache.move_to_end(key)
+        return cached[1]
+
+
+def cache_explanation(prompt: str, explanation: str) -> None:
+    if not explanation:
+        return
+    key = _explanation_cache_key(prompt)
+    with _explanation_cache_lock:
+        _explanation_cache[key] = (time.monotonic() + EXPLANATION_CACHE_TTL_SECONDS, explanation)
+        _explanation_cache.move_to_end(key)
+        while len(_explanation_cache) > EXPLANATION_CACHE_MAX_ENTRIES:
+            _explanation_cache.popitem(last=False)
+
+
+def clear_explanation_cache() -> None:
+    with _explanation_cache_lock:
+        _explanation_cache.clear()
+
+
+# Bonus lookup result for cards with no bonus in the requested category.
+_NO_BONUS: Dict[str, Any] = {
+    "is_bonus_eligible": False,
+    "bonus_rate": None,
+    "bonus_cap_sgd": None,
+    "bonus_min_spend_sgd": None,
+}
+
+
+def _bonus_data(bonus: CardBonusCategory) -> Dict[str, Any]:
+    return {
+        "is_bonus_eligible": True,
+        "bonus_rate": bonus.bonus_benefit_rate,
+        "bonus_cap_sgd": bonus.bonus_cap_in_dollar,
+        "bonus_min_spend_sgd": bonus.bonus_minimum_spend_in_dollar
+    }
+
+
 # =============================================================================
 # Explanation Service
 # =============================================================================
@@ -170,6 +363,65 @@ class ExplanationService:
         # Step 2: Get bonus category data (if applicable)
         bonus_data = self._get_bonus_for_category(card_id, category)
         
+        return self._context_from_rows(card, bonus_data, category, transaction_amount, merchant_name)
+    
+    def build_contexts_from_db(
+        self,
+        card_ids: List[int],
+        category: str,
+        transaction_amount: Decimal,
+        merchant_name: Optional[str] = None
+    ) -> List[RecommendationContext]:
+        """
+        Batched build_context_from_db for a recommended card and its alternatives.
+        
+        Issues one query for the cards and one for their bonus rules, however
+        many cards are requested.
+        
+        Args:
+            card_ids: Card IDs in the order the contexts should be returned
+            category: Transaction category (e.g., "Fashion", "Food")
+            transaction_amount: Transaction value in SGD
+            merchant_name: Optional merchant identifier
+        
+        Returns:
+            One RecommendationContext per card_id, in the same order
+        
+        Raises:
+            ValueError: If any card_id is not found in database
+        """
+        if not card_ids:
+            return []
+        
+        cards = {
+            card.card_id: card
+            for card in self.db.query(CardCatalogue).filter(CardCatalogue.card_id.in_(card_ids)).all()
+        }
+        for card_id in card_ids:
+            if card_id not in cards:
+                raise ValueError(f"Card ID {card_id} not found in card_catalogue")
+        
+        bonuses = self._get_bonuses_for_category(card_ids, category)
+        return [
+            self._context_from_rows(
+                cards[card_id],
+                bonuses.get(card_id, _NO_BONUS),
+                category,
+                transaction_amount,
+                merchant_name,
+            )
+            for card_id in card_ids
+        ]
+    
+    @staticmethod
+    def _context_from_rows(
+        card: CardCatalogue,
+        bonus_data: Dict[str, Any],
+        category: str,
+        transaction_amount: Decimal,
+        merchant_name: Optional[str],
+    ) -> RecommendationContext:
+        """Compute the reward for one card and wrap it in a RecommendationContext."""
         # Step 3: Compute reward value
         bonus_min_spend_val = bonus_data.get("bonus_min_spend_sgd")
         bonus_min_spend_sgd = Decimal(bonus_min_spend_val) if bonus_min_spend_val is not None else Decimal(0)
@@ -220,12 +472,7 @@ class ExplanationService:
             normalized_category = BonusCategory[category]
         except KeyError:
             # Category doesn't match any bonus category
-            return {
-                "is_bonus_eligible": False,
-                "bonus_rate": None,
-                "bonus_cap_sgd": None,
-                "bonus_min_spend_sgd": None
-            }
+            return _NO_BONUS
         
         # Query for specific category or "All" category
         bonus = self.db.query(CardBonusCategory).filter(
@@ -236,19 +483,34 @@ class ExplanationService:
         ).first()
         
         if bonus:
-            return {
-                "is_bonus_eligible": True,
-                "bonus_rate": bonus.bonus_benefit_rate,
-                "bonus_cap_sgd": bonus.bonus_cap_in_dollar,
-                "bonus_min_spend_sgd": bonus.bonus_minimum_spend_in_dollar
-            }
+            return _bonus_data(bonus)
         
-        return {
-            "is_bonus_eligible": False,
-            "bonus_rate": None,
-            "bonus_cap_sgd": None,
-            "bonus_min_spend_sgd": None
-        }
+        return _NO_BONUS
+    
+    def _get_bonuses_for_category(self, card_ids: List[int], category: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Batched _get_bonus_for_category: the best matching bonus per card.
+        
+        Cards without a matching bonus are left out of the result.
+        """
+        try:
+            normalized_category = BonusCategory[category]
+        except KeyError:
+            return {}
+        
+        rows = self.db.query(CardBonusCategory).filter(
+            CardBonusCategory.card_id.in_(card_ids),
+            CardBonusCategory.bonus_category.in_([normalized_category, BonusCategory.All])
+        ).order_by(
+            CardBonusCategory.card_id,
+            CardBonusCategory.bonus_benefit_rate.desc()  # Prioritize higher rate
+        ).all()
+        
+        bonuses: Dict[int, Dict[str, Any]] = {}
+        for bonus in rows:
+            if bonus.card_id not in bonuses:
+                bonuses[bonus.card_id] = _bonus_data(bonus)
+        return bonuses
     
     def generate_explanation(
         self,
@@ -278,6 +540,106 @@ class ExplanationService:
         # Try LLM generation
         explanation_text, model_used, is_fallback = self._try_llm_generation(prompt, context)
         
+        return self._build_response(context, explanation_text, model_used, is_fallback, start_time)
+
+    async def generate_explanation_async(
+        self,
+        request: ExplanationRequest
+    ) -> ExplanationResponse:
+        """
+        Async variant of `generate_explanation`.
+
+        Same flow and response; the LLM call is awaited on the event loop
+        instead of holding a worker thread for the whole round-trip.
+        """
+        start_time = time.time()
+        context = request.recommendation
+        prompt = self._build_prompt(context, request.comparison_cards)
+        explanation_text, model_used, is_fallback = await self._try_llm_generation_async(prompt, context)
+        return self._build_response(context, explanation_text, model_used, is_fallback, start_time)
+
+    async def stream_explanation(
+        self,
+        request: ExplanationRequest
+    ) -> AsyncIterator[str]:
+        """
+        Stream the explanation text as the LLM produces it.
+
+        Yields text from a `stream=True` completion, with deltas coalesced by
+        `batch_stream` using the LLM_STREAM_* settings. Without a client,
+        or if the call fails before any text arrives, the template fallback
+        is yielded as a single chunk; a failure mid-stream raises
+        `ExplanationStreamInterrupted` after the text already yielded.
+        LLM_REQUEST_TIMEOUT bounds the whole stream, not just its first byte.
+        """
+        context = request.recommendation
+        if not async_openai_client:
+            logger.debug("OpenAI client not available, using template fallback")
+            yield self._generate_template_fallback(context)
+            return
+
+        # Deltas are batched so each HTTP chunk carries several tokens.
+        async for batch in batch_stream(
+            self._stream_llm_deltas(request),
+            max_batch_size=LLMConfig.STREAM_MAX_BATCH_SIZE,
+            growth_factor=LLMConfig.STREAM_BATCH_SIZE_GROWTH_FACTOR,
+            flush_interval_ms=LLMConfig.STREAM_FLUSH_INTERVAL_MS,
+        ):
+            yield batch
+
+    async def _stream_llm_deltas(
+        self,
+        request: ExplanationRequest
+    ) -> AsyncIterator[str]:
+        context = request.recommendation
+        prompt = self._build_prompt(context, request.comparison_cards)
+        cached = get_cached_explanation(prompt)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: list[str] = []
+        # One deadline covers opening the stream and reading every chunk, so a
+        # response that trickles in slowly is cut off too.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LLMConfig.REQUEST_TIMEOUT_SECONDS
+        stream = None
+        try:
+            stream = await asyncio.wait_for(
+                async_openai_client.chat.completions.create(**self._llm_request(prompt), stream=True),
+                timeout=LLMConfig.REQUEST_TIMEOUT_SECONDS,
+            )
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(stream), max(deadline - loop.time(), 0))
+                except StopAsyncIteration:
+                    break
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            if isinstance(stream, AsyncStream):
+                # Release the HTTP connection of an abandoned stream.
+                await stream.close()
+            if parts:
+                logger.error(f"LLM stream interrupted: {e!r}")
+                raise ExplanationStreamInterrupted(str(e) or type(e).__name__) from e
+            explanation_text, _, _ = self._llm_error_fallback(e, context)
+            yield explanation_text
+            return
+        cache_explanation(prompt, "".join(parts).strip())
+
+    @staticmethod
+    def _build_response(
+        context: RecommendationContext,
+        explanation_text: str,
+        model_used: str,
+        is_fallback: bool,
+        start_time: float,
+    ) -> ExplanationResponse:
         # Calculate generation time
         generation_time_ms = int((time.time() - start_time) * 1000)
         
@@ -395,33 +757,80 @@ Ground Truth Facts:
         if not openai_client:
             logger.debug("OpenAI client not available, using template fallback")
             return self._generate_template_fallback(context), "template", True
-        
+
+        cached = get_cached_explanation(prompt)
+        if cached is not None:
+            return cached, LLMConfig.MODEL, False
+
+        try:
+            response = openai_client.chat.completions.create(**self._llm_request(prompt))
+        except Exception as e:
+            return self._llm_error_fallback(e, context)
+        return self._llm_success(prompt, response)
+
+    async def _try_llm_generation_async(
+        self,
+        prompt: str,
+        context: RecommendationContext
+    ) -> tuple[str, str, bool]:
+        """Async counterpart of `_try_llm_generation`, using the async OpenAI client."""
+        if not async_openai_client:
+            logger.debug("OpenAI client not available, using template fallback")
+            return self._generate_template_fallback(context), "template", True
+
+        cached = get_cached_explanation(prompt)
+        if cached is not None:
+            return cached, LLMConfig.MODEL, False
+
         try:
-            response = openai_client.chat.completions.create(
-                model=LLMConfig.MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a helpful Singapore credit card advisor."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=LLMConfig.TEMPERATURE,
-                max_tokens=LLMConfig.MAX_TOKENS
+            response = await asyncio.wait_for(
+                async_openai_client.chat.completions.create(**self._llm_request(prompt)),
+                timeout=LLMConfig.REQUEST_TIMEOUT_SECONDS,
             )
-            
-            explanation = (response.choices[0].message.content or "").strip()
-            logger.info(f"LLM explanation generated successfully (model: {LLMConfig.MODEL})")
-            return explanation, LLMConfig.MODEL, False
-        
-        except APITimeoutError:
+        except Exception as e:
+            return self._llm_error_fallback(e, context)
+        return self._llm_success(prompt, response)
+
+    @staticmethod
+    def _llm_request(prompt: str) -> Dict[str, Any]:
+        return {
+            "model": LLMConfig.MODEL,
+            "messages": [
+                {"role": "system", "content": "You are a helpful Singapore credit card advisor."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": LLMConfig.TEMPERATURE,
+            "max_tokens": LLMConfig.MAX_TOKENS,
+        }
+
+    @staticmethod
+    def _llm_success(prompt: str, response: Any) -> tuple[str, str, bool]:
+        explanation = (response.choices[0].message.content or "").strip()
+        logger.info(f"LLM explanation generated successfully (model: {LLMConfig.MODEL})")
+        cache_explanation(prompt, explanation)
+        return explanation, LLMConfig.MODEL, False
+
+    def _llm_error_fallback(
+        self,
+        error: Exception,
+        context: RecommendationContext
+    ) -> tuple[str, str, bool]:
+        if isinstance(error, APITimeoutError):
             logger.warning(f"OpenAI API timeout after {LLMConfig.TIMEOUT_SECONDS}s, using fallback")
             return self._generate_template_fallback(context), "template_timeout", True
+
+        if isinstance(error, asyncio.TimeoutError):
+            logger.warning(
+                f"OpenAI API call exceeded {LLMConfig.REQUEST_TIMEOUT_SECONDS}s deadline, using fallback"
+            )
+            return self._generate_template_fallback(context), "template_timeout", True
         
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}, using fallback")
+        if isinstance(error, APIError):
+            logger.error(f"OpenAI API error: {error}, using fallback")
             return self._generate_template_fallback(context), "template_error", True
         
-        except Exception as e:
-            logger.error(f"Unexpected error during LLM generation: {e}, using fallback")
-            return self._generate_template_fallback(context), "template_exception", True
+        logger.error(f"Unexpected error during LLM generation: {error}, using fallback")
+        return self._generate_template_fallback(context), "template_exception", True
     
     def _generate_template_fallback(self, context: RecommendationContext) -> str:
         """
@@ -498,3 +907,24 @@ Ground Truth Facts:
             prompt_hash=prompt_hash,
             response_length=len(response.explanation)
         )
+
+    def persist_audit_log(self, audit: AuditLogEntry) -> None:
+        """
+        Store an audit entry in `security_logs`.
+
+        Meant to run as a background task after the response is sent, so it
+        opens its own short-lived session on the same engine rather than
+        reusing the request session, which is closed by then. Failures are
+        logged and never raised.
+        """
+        try:
+            with Session(self.db.get_bind()) as session:
+                log_security_event(
+                    session,
+                    event_type=SecurityEventType.GENAI_EXPLANATION_AUDIT,
+                    source="card_reasoner.explain_db_audit",
+                    user_id=audit.user_id,
+                    details=audit.model_dump(),
+                )
+        except Exception:
+            logger.exception("Failed to persist explanation audit log")
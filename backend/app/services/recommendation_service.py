@@ -1,22 +1,50 @@
 from __future__ import annotations
 
 import calendar
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional, cast
 
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 # Import models to ensure SQLAlchemy relationship targets are registered.
-from app.models.transaction import UserTransaction  # noqa: F401
+from app.models.transaction import UserTransaction
 from app.models.user_profile import UserProfile  # noqa: F401
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.card_catalogue import CardCatalogue
 from app.models.card_bonus_category import BonusCategory, CardBonusCategory
 
 
+# Daily spend per card for a user since a given date. Recommendations read
+# every owned card's current-cycle spend from this one grouped query (cycles
+# start on different days, so days before each card's start are dropped in
+# Python) instead of running one SUM per card.
+STMT_CYCLE_SPEND = (
+    select(
+        UserTransaction.card_id,
+        UserTransaction.transaction_date,
+        func.sum(UserTransaction.amount_sgd),
+    )
+    .where(
+        UserTransaction.user_id == bindparam("user_id"),
+        UserTransaction.card_id.in_(bindparam("card_ids", expanding=True)),
+        UserTransaction.transaction_date >= bindparam("since"),
+    )
+    .group_by(UserTransaction.card_id, UserTransaction.transaction_date)
+)
+
+
+def _as_decimal(value) -> Decimal:
+    # Numeric columns already load as Decimal; only other values (e.g. floats
+    # from SQLite aggregates) are converted, via str to keep their digits.
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 @dataclass(frozen=True)
 class BonusRuleDTO:
     bonus_category: str
@@ -59,6 +87,44 @@ class CardRecommendationDTO:
     reward_breakdown: RewardBreakdownDTO
 
 
+RecommendResult = tuple[Optional[CardRecommendationDTO], list[CardRecommendationDTO]]
+
+# Recent `recommend` results, reused by `recommend_cached` for identical
+# requests. Write paths that change a user's inputs (wallet, transactions,
+# profile preference, card rewards) call `invalidate_recommendations`; the TTL
+# bounds staleness across worker processes. Each entry is
+# (expires_at, result, encoded response body or None), so a route that encodes
+# the result once serves the same bytes until the entry expires or is dropped.
+RECOMMENDATION_CACHE_TTL_SECONDS = 30
+RECOMMENDATION_CACHE_MAX_ENTRIES = 4096
+
+_recommendation_cache: "OrderedDict[tuple[Any, ...], tuple[float, RecommendResult, Optional[bytes]]]" = OrderedDict()
+_recommendation_cache_lock = threading.Lock()
+# Bumped by every invalidation (per user, and globally for user_id=None). A
+# result computed while the generation changed may predate the write that
+# invalidated it, so it is returned but not stored.
+_recommendation_generation = 0
+_recommendation_user_generations: dict[int, int] = {}
+
+
+def _cache_generation(user_id: int) -> tuple[int, int]:
+    # Caller holds _recommendation_cache_lock.
+    return _recommendation_generation, _recommendation_user_generations.get(user_id, 0)
+
+
+def invalidate_recommendations(user_id: Optional[int] = None) -> None:
+    """Drop cached recommendations for one user, or for everyone when user_id is None."""
+    global _recommendation_generation
+    with _recommendation_cache_lock:
+        if user_id is None:
+            _recommendation_generation += 1
+            _recommendation_cache.clear()
+            return
+        _recommendation_user_generations[user_id] = _recommendation_user_generations.get(user_id, 0) + 1
+        for key in [key for key in _recommendation_cache if key[1] == user_id]:
+            del _recommendation_cache[key]
+
+
 class RecommendationService:
     def __init__(self, db: Session):
         self.db = db
@@ -116,14 +182,13 @@ class RecommendationService:
         if not active_cards:
             return None, []
 
-        current_cycle_spend_by_card = {
-            uc.card_id: self._get_current_cycle_spend(
-                user_id=user_id,
-                card_id=uc.card_id,
-                cycle_start_date=self._latest_cycle_start_date(uc.billing_cycle_refresh_date.day),
-            )
-            for uc in active_cards
-        }
+        current_cycle_spend_by_card = self._get_current_cycle_spend_by_card(
+            user_id=user_id,
+            cycle_start_by_card={
+                uc.card_id: self._latest_cycle_start_date(uc.billing_cycle_refresh_date.day)
+                for uc in active_cards
+            },
+        )
 
         card_ids = [uc.card_id for uc in active_cards]
         catalog_rows = (
@@ -148,7 +213,7 @@ class RecommendationService:
             if not card:
                 continue
 
-            base_rate = Decimal(str(card.base_benefit_rate))
+            base_rate = _as_decimal(card.base_benefit_rate)
             effective_rate = base_rate
             applied_category: Optional[str] = None
 
@@ -169,15 +234,15 @@ class RecommendationService:
                 amount_sgd=amount_sgd,
             )
             if matching_rules:
-                selected_rule = max(matching_rules, key=lambda r: Decimal(str(r.bonus_benefit_rate)))
-                effective_rate = Decimal(str(selected_rule.bonus_benefit_rate))
+                selected_rule = max(matching_rules, key=lambda r: _as_decimal(r.bonus_benefit_rate))
+                effective_rate = _as_decimal(selected_rule.bonus_benefit_rate)
                 applied_category = str(
                     selected_rule.bonus_category.value
                     if hasattr(selected_rule.bonus_category, "value")
                     else selected_rule.bonus_category
                 )
                 min_spend_required = int(selected_rule.bonus_minimum_spend_in_dollar)
-                min_spend_met = amount_sgd is None or amount_sgd >= Decimal(min_spend_required)
+                min_spend_met = amount_sgd is None or amount_sgd >= min_spend_required
                 cap_in_dollar = int(selected_rule.bonus_cap_in_dollar)
                 rate_source = "bonus"
 
@@ -188,7 +253,7 @@ class RecommendationService:
                 reward_after_cap = Decimal("0")
                 cap_applied = False
             else:
-                amount_for_calc = Decimal(str(amount_sgd))
+                amount_for_calc = _as_decimal(amount_sgd)
                 reward_before_cap, reward_after_cap, cap_applied = self._estimate_reward(
                     amount_sgd=amount_for_calc,
                     reward_unit=reward_unit,
@@ -222,7 +287,7 @@ class RecommendationService:
                     bonus_rules=[
                         BonusRuleDTO(
                             bonus_category=str(r.bonus_category.value if hasattr(r.bonus_category, "value") else r.bonus_category),
-                            bonus_benefit_rate=Decimal(str(r.bonus_benefit_rate)),
+                            bonus_benefit_rate=_as_decimal(r.bonus_benefit_rate),
                             bonus_cap_in_dollar=int(r.bonus_cap_in_dollar),
                             bonus_minimum_spend_in_dollar=int(r.bonus_minimum_spend_in_dollar),
                         )
@@ -268,15 +333,104 @@ class RecommendationService:
             ranked.sort(key=lambda c: (c.effective_benefit_rate, c.base_benefit_rate), reverse=True)
         return (ranked[0] if ranked else None), ranked
 
-    def _get_current_cycle_spend(self, *, user_id: int, card_id: int, cycle_start_date: date) -> Decimal:
-        total = (
-            self.db.query(func.coalesce(func.sum(UserTransaction.amount_sgd), 0))
-            .filter(UserTransaction.user_id == user_id)
-            .filter(UserTransaction.card_id == card_id)
-            .filter(UserTransaction.transaction_date >= cycle_start_date)
-            .scalar()
+    def recommend_cached(
+        self,
+        *,
+        user_id: int,
+        category: Optional[BonusCategory] = None,
+        amount_sgd: Optional[Decimal] = None,
+        preference: Optional[str] = None,
+    ) -> RecommendResult:
+        """`recommend`, reusing a result computed for the same arguments within the TTL."""
+        result, _ = self._recommend_cached(
+            user_id=user_id, category=category, amount_sgd=amount_sgd, preference=preference
+        )
+        return result
+
+    def recommend_cached_encoded(
+        self,
+        encode: Callable[[RecommendResult], bytes],
+        *,
+        user_id: int,
+        category: Optional[BonusCategory] = None,
+        amount_sgd: Optional[Decimal] = None,
+        preference: Optional[str] = None,
+    ) -> tuple[RecommendResult, bytes]:
+        """`recommend_cached` plus `encode(result)`, cached in the same entry as the result."""
+        result, body = self._recommend_cached(
+            user_id=user_id, category=category, amount_sgd=amount_sgd, preference=preference, encode=encode
+        )
+        return result, cast(bytes, body)
+
+    def _recommend_cached(
+        self,
+        *,
+        user_id: int,
+        category: Optional[BonusCategory],
+        amount_sgd: Optional[Decimal],
+        preference: Optional[str],
+        encode: Optional[Callable[[RecommendResult], bytes]] = None,
+    ) -> tuple[RecommendResult, Optional[bytes]]:
+        # The engine is part of the key so separate databases never share entries.
+        key = (
+            self.db.get_bind(),
+            user_id,
+            getattr(category, "value", category),
+            None if amount_sgd is None else str(amount_sgd),
+            preference,
+        )
+        now = time.monotonic()
+        with _recommendation_cache_lock:
+            generation = _cache_generation(user_id)
+            cached = _recommendation_cache.get(key)
+            if cached is not None and cached[0] <= now:
+                cached = None
+            if cached is not None:
+                _recommendation_cache.move_to_end(key)
+                if encode is None or cached[2] is not None:
+                    return cached[1], cached[2]
+
+        if cached is not None:
+            expires_at, result = cached[0], cached[1]
+        else:
+            expires_at = now + RECOMMENDATION_CACHE_TTL_SECONDS
+            result = self.recommend(
+                user_id=user_id,
+                category=category,
+                amount_sgd=amount_sgd,
+                preference=preference,
+            )
+        body = encode(result) if encode is not None else None
+        with _recommendation_cache_lock:
+            if _cache_generation(user_id) != generation or (
+                cached is not None and _recommendation_cache.get(key) is not cached
+            ):
+                # Invalidated (or replaced) while computing; do not bring it back.
+                return result, body
+            _recommendation_cache[key] = (expires_at, result, body)
+            _recommendation_cache.move_to_end(key)
+            while len(_recommendation_cache) > RECOMMENDATION_CACHE_MAX_ENTRIES:
+                _recommendation_cache.popitem(last=False)
+        return result, body
+
+    def _get_current_cycle_spend_by_card(
+        self, *, user_id: int, cycle_start_by_card: dict[int, date]
+    ) -> dict[int, Decimal]:
+        totals = {card_id: Decimal("0") for card_id in cycle_start_by_card}
+        if not cycle_start_by_card:
+            return totals
+        rows = self.db.execute(
+            STMT_CYCLE_SPEND,
+            {
+                "user_id": user_id,
+                "card_ids": list(cycle_start_by_card),
+                "since": min(cycle_start_by_card.values()),
+            },
         )
-        return Decimal(str(total or 0))
+        for card_id, txn_date, amount in rows:
+            if txn_date >= cycle_start_by_card[card_id]:
+                totals[card_id] += _as_decimal(amount or 0)
+        return totals
 
     @staticmethod
     def _latest_cycle_start_date(refresh_day_of_month: int) -> date:
@@ -313,7 +467,7 @@ class RecommendationService:
             if rule.bonus_category not in allowed:
                 continue
             if amount_sgd is not None:
-                if amount_sgd < Decimal(int(rule.bonus_minimum_spend_in_dollar)):
+                if amount_sgd < int(rule.bonus_minimum_spend_in_dollar):
                     continue
             matches.append(rule)
         return matches
@@ -1,6 +1,6 @@
 from datetime import date, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Float, case, func
 # Attempt to import ServiceException; provide fallback if module not available
 try:
     from app.exceptions import ServiceException
@@ -11,7 +11,6 @@ except ImportError:
 from app.models.transaction import UserTransaction
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.card_catalogue import CardCatalogue
-from app.models.card_bonus_category import BonusCategory, CardBonusCategory
 
 class RewardsEarnedService:
     def __init__(self, db_session: Session):
@@ -31,8 +30,14 @@ class RewardsEarnedService:
         - ServiceException: If any error occurs during calculation
         """
         # Step 1: Get all active cards for the user
+        # Catalogue rows and their bonus rules come back in two IN-queries for
+        # the whole wallet instead of two queries per card.
         active_cards = (
             self.db_session.query(UserOwnedCard)
+            .options(
+                selectinload(UserOwnedCard.card_catalogue)
+                .selectinload(CardCatalogue.bonus_categories)
+            )
             .filter(
                 UserOwnedCard.user_id == user_id,
                 UserOwnedCard.status == UserOwnedCardStatus.Active
@@ -47,7 +52,7 @@ class RewardsEarnedService:
             rewards_by_card = {}  # Dictionary to store rewards for each card
             
             for user_card in active_cards:
-                card = self.db_session.query(CardCatalogue).filter(CardCatalogue.card_id == user_card.card_id).first()
+                card = user_card.card_catalogue
                 if not card:
                     continue  # Skip if card details not found
                 
@@ -66,36 +71,33 @@ class RewardsEarnedService:
                     billing_cycle_start_date = prev_month_last.replace(day=day_of_month)
                 
                 # Get bonus categories for the card
-                bonus_categories_all = (
-                    self.db_session.query(CardBonusCategory)
-                    .filter(CardBonusCategory.card_id == card.card_id)
-                    .all()
-                )
+                bonus_categories_all = list(card.bonus_categories)
                 bonus_categories = [bonus.bonus_category.value for bonus in bonus_categories_all]
 
-                # Get all transactions for the card in the latest billing cycle
-                transactions = (
-                    self.db_session.query(UserTransaction)
+                # Sum the card's spend in the latest billing cycle in SQL, split
+                # into total and bonus-category spend, and return it as floats
+                # rather than fetching every transaction row.
+                spend = (
+                    self.db_session.query(
+                        func.coalesce(func.sum(UserTransaction.amount_sgd), 0).cast(Float),
+                        func.coalesce(
+                            func.sum(
+                                case(
+                                    (UserTransaction.category.in_(bonus_categories), UserTransaction.amount_sgd),
+                                    else_=0,
+                                )
+                            ),
+                            0,
+                        ).cast(Float),
+                    )
                     .filter(
                         UserTransaction.user_id == user_id,
                         UserTransaction.card_id == card.card_id,
                         UserTransaction.transaction_date >= billing_cycle_start_date
                     )
-                    .all()
+                    .first()
                 )
-
-                # For each transaction, determine whether it falls under base or bonus category, calculate rewards, and exclude any bonus rewards exceeding the cap
-                bonus_txn_amount = 0.0
-                total_txn_amount = 0.0
-                for txn in transactions:
-                    reward_rate = card.base_benefit_rate
-                    
-                    # Check if transaction category matches any bonus category
-                    if txn.category.value in bonus_categories:
-                        bonus_txn_amount += float(txn.amount_sgd)
-                        total_txn_amount += float(txn.amount_sgd)
-                    else:
-                        total_txn_amount += float(txn.amount_sgd)
+                total_txn_amount, bonus_txn_amount = spend or (0.0, 0.0)
 
                     # If there are bonus transactions, check against the cap
                 if bonus_categories_all:  # Check if there are bonus categories
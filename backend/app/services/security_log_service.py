@@ -17,6 +17,7 @@ class SecurityEventType:
     OTP_REQUEST = "otp.request"
     OTP_VERIFY = "otp.verify"
     GENAI_ACCESS = "genai.access"
+    GENAI_EXPLANATION_AUDIT = "genai.explanation_audit"
 
 
 SENSITIVE_KEYS = {
@@ -1,26 +1,79 @@
 from datetime import date
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, cast
 
-from sqlalchemy import String, cast as sa_cast, func, or_
+from sqlalchemy import String, bindparam, cast as sa_cast, func, insert, or_, select
 from sqlalchemy.orm import Session
 
+from app.db.bulk import chunk_size_for, iter_chunks
 from app.models.transaction import TransactionCreate, UserTransaction, TransactionStatus
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.user_profile import UserProfile
 from app.services.errors import ServiceError
+from app.services.user_id_utils import parse_user_id
+from app.services.recommendation_service import invalidate_recommendations
+
+
+# Columns read by `_transaction_to_dict`. List endpoints select just these as
+# plain rows so large histories skip ORM identity-map and instance hydration.
+_TRANSACTION_COLUMNS = (
+    UserTransaction.id,
+    UserTransaction.user_id,
+    UserTransaction.card_id,
+    UserTransaction.amount_sgd,
+    UserTransaction.item,
+    UserTransaction.channel,
+    UserTransaction.category,
+    UserTransaction.is_overseas,
+    UserTransaction.status,
+    UserTransaction.transaction_date,
+)
+
+# History statements are built once at import time; call sites only bind
+# `user_id`, so SQLAlchemy reuses the compiled form without rebuilding the
+# statement or its cache key per request.
+_STMT_TX_BY_USER_BASE = select(*_TRANSACTION_COLUMNS).where(UserTransaction.user_id == bindparam("user_id"))
+STMT_TX_BY_USER = _STMT_TX_BY_USER_BASE.order_by(UserTransaction.transaction_date.desc())
+STMT_TX_BY_USER_ASC = _STMT_TX_BY_USER_BASE.order_by(UserTransaction.transaction_date.asc())
+
+
+# Accepted status inputs, current and legacy, mapped to the canonical status
+# they are stored as.
+_STATUS_BY_VALUE: Dict[str, TransactionStatus] = {
+    "active": TransactionStatus.Active,
+    "deleted_with_card": TransactionStatus.DeletedWithCard,
+    "Active": TransactionStatus.Active,
+    "DeletedWithCard": TransactionStatus.DeletedWithCard,
+}
+_VALID_STATUSES = list(_STATUS_BY_VALUE)
+
+
+def _parse_status(status: str) -> TransactionStatus:
+    # Called before the user id is resolved, so a bad status is rejected
+    # without any database lookup.
+    status_enum = _STATUS_BY_VALUE.get(status)
+    if status_enum is None:
+        raise ServiceError(
+            400,
+            "VALIDATION_ERROR",
+            f"Invalid status '{status}'. Must be one of: {', '.join(_VALID_STATUSES)}",
+            {"field": "status", "valid_values": _VALID_STATUSES},
+        )
+    return status_enum
 
 
 class TransactionService:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def _resolve_user_id(self, user_id: Optional[str]) -> int:
-        raw_user_id = (user_id or "").strip()
-        if raw_user_id.isdigit():
-            return int(raw_user_id)
-        if raw_user_id.startswith("u_") and raw_user_id[2:].isdigit():
-            return int(raw_user_id[2:])
+    def _resolve_user_id(self, user_id: Optional[str | int]) -> int:
+        if isinstance(user_id, int):
+            # Already resolved by the caller.
+            return user_id
+        parsed_user_id = parse_user_id(user_id)
+        if parsed_user_id is not None:
+            return parsed_user_id
 
+        raw_user_id = (user_id or "").strip()
         user = self.db.query(UserProfile).filter(UserProfile.username == raw_user_id).first()
         if not user:
             raise ServiceError(404, "NOT_FOUND", "Profile not found.", {})
@@ -32,7 +85,7 @@ class TransactionService:
     def _parse_card_id(self, card_id: Any) -> int:
         if isinstance(card_id, int):
             return card_id
-        if isinstance(card_id, str) and card_id.isdigit():
+        if isinstance(card_id, str) and card_id.isdecimal():
             return int(card_id)
         raise ServiceError(
             400,
@@ -56,10 +109,27 @@ class TransactionService:
             is not None
         )
 
-    def _transaction_to_dict(self, txn: UserTransaction) -> Dict[str, Any]:
-        channel_value = str(txn.channel.value if hasattr(txn.channel, "value") else txn.channel).lower()
-        status_value = str(txn.status.value if hasattr(txn.status, "value") else txn.status).lower()
-        category_raw = txn.category.value if txn.category else None
+    def _wallet_card_ids(self, user_id: int, card_ids: set[int]) -> set[int]:
+        rows = (
+            self.db.query(UserOwnedCard.card_id)
+            .filter(
+                UserOwnedCard.user_id == user_id,
+                UserOwnedCard.card_id.in_(card_ids),
+                or_(
+                    UserOwnedCard.status == UserOwnedCardStatus.Active,
+                    func.lower(sa_cast(UserOwnedCard.status, String)) == "active",
+                ),
+            )
+            .distinct()
+            .all()
+        )
+        return {row.card_id for row in rows}
+
+    def _transaction_to_dict(self, txn: Any) -> Dict[str, Any]:
+        """Serialize a `UserTransaction` or a row selected with `_TRANSACTION_COLUMNS`."""
+        channel_value = str(getattr(txn.channel, "value", txn.channel)).lower()
+        status_value = str(getattr(txn.status, "value", txn.status)).lower()
+        category_raw = getattr(txn.category, "value", txn.category)
         category_value = str(category_raw).lower() if category_raw else None
 
         return {
@@ -91,30 +161,87 @@ class TransactionService:
             )
 
         transaction_date = payload.transaction_date or date.today()
-        record = UserTransaction(
-            user_id=resolved_user_id,
-            card_id=card_id,
-            amount_sgd=payload.amount_sgd,
-            item=payload.item,
-            channel=payload.channel,
-            category=payload.category,
-            is_overseas=payload.is_overseas,
-            transaction_date=transaction_date,
+        # INSERT ... RETURNING hands back id and defaulted columns in the same
+        # round-trip; serialize before commit, which would expire the instance.
+        stmt = (
+            insert(UserTransaction)
+            .values(
+                user_id=resolved_user_id,
+                card_id=card_id,
+                amount_sgd=payload.amount_sgd,
+                item=payload.item,
+                channel=payload.channel,
+                category=payload.category,
+                is_overseas=payload.is_overseas,
+                transaction_date=transaction_date,
+            )
+            .returning(UserTransaction)
         )
+        record = self.db.scalars(stmt).one()
+        result = self._transaction_to_dict(record)
+        self.db.commit()
+        invalidate_recommendations(resolved_user_id)
+        return result
 
-        self.db.add(record)
+    def _build_bulk_rows(
+        self, user_id: Optional[str], payloads: Sequence[TransactionCreate]
+    ) -> List[Dict[str, Any]]:
+        """Validate a batch against the wallet (one query) and return insert-ready rows."""
+        resolved_user_id = self._resolve_user_id(user_id or "u_001")
+        card_ids = [self._parse_card_id(payload.card_id) for payload in payloads]
+        missing = set(card_ids) - self._wallet_card_ids(resolved_user_id, set(card_ids))
+        if missing:
+            raise ServiceError(
+                400,
+                "VALIDATION_ERROR",
+                f"card_id '{min(missing)}' not found in user wallet",
+                {"card_ids": sorted(missing)},
+            )
+
+        today = date.today()
+        return [
+            {
+                "user_id": resolved_user_id,
+                "card_id": card_id,
+                "amount_sgd": payload.amount_sgd,
+                "item": payload.item,
+                "channel": payload.channel,
+                "category": payload.category,
+                "is_overseas": payload.is_overseas,
+                "transaction_date": payload.transaction_date or today,
+            }
+            for payload, card_id in zip(payloads, card_ids)
+        ]
+
+    def create_many(self, user_id: Optional[str], payloads: Sequence[TransactionCreate]) -> List[Dict[str, Any]]:
+        """Insert several transactions for one user with multi-row INSERT ... RETURNING.
+
+        All card ids are checked against the wallet in a single query, and rows are
+        written in chunks so each chunk is one statement instead of one per row.
+        Results are returned in the same order as `payloads`.
+        """
+        if not payloads:
+            return []
+
+        rows = self._build_bulk_rows(user_id, payloads)
+        stmt = insert(UserTransaction).returning(UserTransaction, sort_by_parameter_order=True)
+        created: List[Dict[str, Any]] = []
+        for chunk in iter_chunks(rows, chunk_size_for(self.db)):
+            created.extend(self._transaction_to_dict(record) for record in self.db.scalars(stmt, chunk))
+        # Serialized before commit: expired instances would each be re-SELECTed.
         self.db.commit()
-        self.db.refresh(record)
-        return self._transaction_to_dict(record)
+        invalidate_recommendations(rows[0]["user_id"])
+        return created
 
-    def get_user_transactions(self, user_id: str, sort_by_date_desc: Optional[bool] = True) -> List[Dict[str, Any]]:
+    def get_user_transactions(self, user_id: str | int, sort_by_date_desc: Optional[bool] = True) -> List[Dict[str, Any]]:
         resolved_user_id = self._resolve_user_id(user_id)
-        query = self.db.query(UserTransaction).filter(UserTransaction.user_id == resolved_user_id)
         if sort_by_date_desc is True:
-            query = query.order_by(UserTransaction.transaction_date.desc())
+            stmt = STMT_TX_BY_USER
         elif sort_by_date_desc is False:
-            query = query.order_by(UserTransaction.transaction_date.asc())
-        rows = query.all()
+            stmt = STMT_TX_BY_USER_ASC
+        else:
+            stmt = _STMT_TX_BY_USER_BASE
+        rows = self.db.execute(stmt, {"user_id": resolved_user_id}).all()
         return [self._transaction_to_dict(row) for row in rows]
 
     def get_transaction_by_id(self, transaction_id: int, user_id: str) -> Dict[str, Any] | None:
@@ -127,18 +254,9 @@ class TransactionService:
         return self._transaction_to_dict(row) if row else None
 
     def update_transaction_status(self, user_id: str, transaction_id: int, status: str) -> Dict[str, Any]:
+        status_enum = _parse_status(status)
         resolved_user_id = self._resolve_user_id(user_id)
         
-        # Validate status
-        valid_statuses = [s.value for s in TransactionStatus]
-        if status not in valid_statuses:
-            raise ServiceError(
-                400,
-                "VALIDATION_ERROR",
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}",
-                {"field": "status", "valid_values": valid_statuses},
-            )
-        
         transaction = (
             self.db.query(UserTransaction)
             .filter(UserTransaction.user_id == resolved_user_id, UserTransaction.id == transaction_id)
@@ -148,27 +266,17 @@ class TransactionService:
         if not transaction:
             raise ServiceError(404, "NOT_FOUND", "Transaction not found.", {})
         
-        transaction.status = TransactionStatus[status.replace("deleted_with_card", "DeletedWithCard").replace("active", "Active")]
+        transaction.status = status_enum
         self.db.commit()
+        invalidate_recommendations(resolved_user_id)
         self.db.refresh(transaction)
         return self._transaction_to_dict(transaction)
     
     def update_transactions_by_card_id(self, user_id: str, card_id: int, status: str) -> int:
         """Update all transactions for a card to the given status. Returns count of updated transactions."""
+        status_enum = _parse_status(status)
         resolved_user_id = self._resolve_user_id(user_id)
         
-        # Validate status
-        valid_statuses = [s.value for s in TransactionStatus]
-        if status not in valid_statuses:
-            raise ServiceError(
-                400,
-                "VALIDATION_ERROR",
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}",
-                {"field": "status", "valid_values": valid_statuses},
-            )
-        
-        status_enum = TransactionStatus[status.replace("deleted_with_card", "DeletedWithCard").replace("active", "Active")]
-        
         count = (
             self.db.query(UserTransaction)
             .filter(UserTransaction.user_id == resolved_user_id, UserTransaction.card_id == card_id)
@@ -176,31 +284,29 @@ class TransactionService:
         )
         
         self.db.commit()
+        invalidate_recommendations(resolved_user_id)
         return count
 
     def bulk_update_transaction_status(self, user_id: str, transaction_ids: List[int], status: str) -> int:
         """Bulk update multiple transactions to the given status. Returns count of updated transactions."""
+        status_enum = _parse_status(status)
         resolved_user_id = self._resolve_user_id(user_id)
+        if not transaction_ids:
+            return 0
         
-        # Validate status
-        valid_statuses = [s.value for s in TransactionStatus]
-        if status not in valid_statuses:
-            raise ServiceError(
-                400,
-                "VALIDATION_ERROR",
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}",
-                {"field": "status", "valid_values": valid_statuses},
+        # One UPDATE ... WHERE id IN (...) per chunk, so very large batches stay
+        # under the driver's bind-parameter limit. Nothing from the table is
+        # loaded in this session, so skip syncing the identity map.
+        count = 0
+        for chunk in iter_chunks(transaction_ids, chunk_size_for(self.db)):
+            count += (
+                self.db.query(UserTransaction)
+                .filter(UserTransaction.user_id == resolved_user_id, UserTransaction.id.in_(chunk))
+                .update({"status": status_enum}, synchronize_session=False)
             )
         
-        status_enum = TransactionStatus[status.replace("deleted_with_card", "DeletedWithCard").replace("active", "Active")]
-        
-        count = (
-            self.db.query(UserTransaction)
-            .filter(UserTransaction.user_id == resolved_user_id, UserTransaction.id.in_(transaction_ids))
-            .update({"status": status_enum})
-        )
-        
         self.db.commit()
+        invalidate_recommendations(resolved_user_id)
         return count
 
     def update_transaction(self, user_id: str, transaction_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -251,6 +357,7 @@ class TransactionService:
                 setattr(transaction, key, value)
         
         self.db.commit()
+        invalidate_recommendations(resolved_user_id)
         self.db.refresh(transaction)
         return self._transaction_to_dict(transaction)
 
@@ -270,5 +377,6 @@ class TransactionService:
         transaction_dict = self._transaction_to_dict(transaction)
         self.db.delete(transaction)
         self.db.commit()
+        invalidate_recommendations(resolved_user_id)
         return transaction_dict
 
@@ -1,8 +1,14 @@
 from typing import Optional, Dict, cast
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardCreate, UserOwnedCardUpdate
 from app.models.user_profile import UserProfile
 from app.exceptions import ServiceException
+from app.services.recommendation_service import invalidate_recommendations
+
+# Mapped column attributes a wallet update may set.
+_UPDATABLE_COLUMNS = frozenset(attr.key for attr in UserOwnedCard.__mapper__.column_attrs)
+
 
 class UserCardManagementService:
     def __init__(self, db: Session):
@@ -47,6 +53,7 @@ class UserCardManagementService:
         )
         self.db.add(new_card)
         self.db.commit()
+        invalidate_recommendations(user_id)
         self.db.refresh(new_card)
         return new_card
 
@@ -62,21 +69,29 @@ class UserCardManagementService:
 
         self.db.delete(card)
         self.db.commit()
+        invalidate_recommendations(user_id)
 
     def update_user_card(self, cognitosub: str, card_id: int, card_data: UserOwnedCardUpdate) -> UserOwnedCard:
         """Update details of a user's card."""
         user_id = self._require_user_id(cognitosub)
-        card = self.db.query(UserOwnedCard).filter(
-            UserOwnedCard.user_id == user_id,
-            UserOwnedCard.card_id == card_id
-        ).first()
+        updates = {
+            key: value
+            for key, value in card_data.model_dump(exclude_unset=True, exclude_none=True).items()
+            if key in _UPDATABLE_COLUMNS
+        }
+        owned = (UserOwnedCard.user_id == user_id, UserOwnedCard.card_id == card_id)
+        if updates:
+            # UPDATE ... RETURNING applies the change and confirms ownership in
+            # one round-trip instead of loading the row first.
+            card = self.db.execute(
+                update(UserOwnedCard).where(*owned).values(**updates).returning(UserOwnedCard)
+            ).scalar_one_or_none()
+        else:
+            card = self.db.query(UserOwnedCard).filter(*owned).first()
         if not card:
             raise ServiceException(status_code=404, detail="User does not own this card.")
 
-        for key, value in card_data.model_dump(exclude_unset=True, exclude_none=True).items():
-            if hasattr(card, key):
-                setattr(card, key, value)
-
         self.db.commit()
+        invalidate_recommendations(user_id)
         self.db.refresh(card)
         return card
\ No newline at end of file
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+def parse_user_id(value: Optional[str]) -> Optional[int]:
+    """Return the numeric id in "42" or the seeded "u_042" form, else None.
+
+    Anything else (e.g. "u42" or "demo") is not an id; callers may treat it
+    as a username.
+    """
+    raw = (value or "").strip()
+    if raw.startswith("u_"):
+        raw = raw[2:]
+    if raw.isdecimal():
+        return int(raw)
+    return None
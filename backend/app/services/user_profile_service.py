@@ -5,6 +5,7 @@ from sqlalchemy.exc import IntegrityError
 
 from app.models.user_profile import BenefitsPreference, UserProfile
 from app.exceptions import ServiceException
+from app.services.recommendation_service import invalidate_recommendations
 
 
 class UserProfileService:
@@ -32,6 +33,7 @@ class UserProfileService:
             user.benefits_preference = benefits_preference
 
         self.db.commit()
+        invalidate_recommendations(user.id)
         self.db.refresh(user)
         return user
 
@@ -0,0 +1,90 @@
+"""store transactions enum columns as strings with check constraints
+
+Revision ID: 3c8f1a2b9d4e
+Revises: 2b7d9e1f4c3a, e7f8a9b0c1d2
+Create Date: 2026-03-18 00:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8f1a2b9d4e"
+down_revision: Union[str, None] = ("2b7d9e1f4c3a", "e7f8a9b0c1d2")
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+CHANNEL_VALUES = ("online", "offline", "Online", "Offline")
+CATEGORY_VALUES = ("Food", "Transport", "Fashion", "Entertainment", "Others")
+STATUS_VALUES = ("active", "deleted_with_card", "Active", "DeletedWithCard")
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    if is_postgres:
+        op.execute("ALTER TABLE transactions ALTER COLUMN status DROP DEFAULT")
+        op.execute("ALTER TABLE transactions ALTER COLUMN channel TYPE VARCHAR(16) USING channel::text")
+        op.execute("ALTER TABLE transactions ALTER COLUMN category TYPE VARCHAR(16) USING category::text")
+        op.execute("ALTER TABLE transactions ALTER COLUMN status TYPE VARCHAR(32) USING status::text")
+        op.execute("ALTER TABLE transactions ALTER COLUMN status SET DEFAULT 'active'")
+        op.execute("DROP TYPE IF EXISTS transactionchannel")
+        op.execute("DROP TYPE IF EXISTS transactioncategory")
+        op.execute("DROP TYPE IF EXISTS transactionstatus")
+
+    # Categories from the original enum that the application no longer models
+    # (e.g. Travel, Shopping, Bills). This rewrite is lossy; see downgrade().
+    result = bind.execute(
+        sa.text(
+            f"UPDATE transactions SET category = 'Others' "
+            f"WHERE category IS NOT NULL AND category NOT IN ({_in_list(CATEGORY_VALUES)})"
+        )
+    )
+    logger.info("Rewrote %d transactions with a legacy category to 'Others'", result.rowcount)
+
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.create_check_constraint("ck_transactions_channel", f"channel IN ({_in_list(CHANNEL_VALUES)})")
+        batch_op.create_check_constraint("ck_transactions_category", f"category IN ({_in_list(CATEGORY_VALUES)})")
+        batch_op.create_check_constraint("ck_transactions_status", f"status IN ({_in_list(STATUS_VALUES)})")
+
+
+def downgrade() -> None:
+    # Not a full round trip: rows that upgrade() moved from a legacy category
+    # to 'Others' keep 'Others', because their original category was not kept.
+    bind = op.get_bind()
+
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_constraint("ck_transactions_status", type_="check")
+        batch_op.drop_constraint("ck_transactions_category", type_="check")
+        batch_op.drop_constraint("ck_transactions_channel", type_="check")
+
+    if bind.dialect.name == "postgresql":
+        channel_enum = sa.Enum(*CHANNEL_VALUES, name="transactionchannel")
+        category_enum = sa.Enum(*CATEGORY_VALUES, name="transactioncategory")
+        status_enum = sa.Enum(*STATUS_VALUES, name="transactionstatus")
+        for enum_type in (channel_enum, category_enum, status_enum):
+            enum_type.create(bind, checkfirst=True)
+
+        op.execute("ALTER TABLE transactions ALTER COLUMN status DROP DEFAULT")
+        op.execute(
+            "ALTER TABLE transactions ALTER COLUMN channel TYPE transactionchannel USING channel::transactionchannel"
+        )
+        op.execute(
+            "ALTER TABLE transactions ALTER COLUMN category TYPE transactioncategory USING category::transactioncategory"
+        )
+        op.execute(
+            "ALTER TABLE transactions ALTER COLUMN status TYPE transactionstatus USING status::transactionstatus"
+        )
+        op.execute("ALTER TABLE transactions ALTER COLUMN status SET DEFAULT 'active'")
@@ -0,0 +1,27 @@
+"""add composite date indexes on transactions
+
+Revision ID: 4d9a2b3c5e6f
+Revises: 3c8f1a2b9d4e
+Create Date: 2026-03-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d9a2b3c5e6f"
+down_revision: Union[str, None] = "3c8f1a2b9d4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tx_user_date", "transactions", ["user_id", "transaction_date"], unique=False)
+    op.create_index("ix_tx_card_date", "transactions", ["card_id", "transaction_date"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tx_card_date", table_name="transactions")
+    op.drop_index("ix_tx_user_date", table_name="transactions")
@@ -0,0 +1,52 @@
+"""server-side defaults for transactions date columns
+
+Revision ID: 5e0b3c4d6f7a
+Revises: 4d9a2b3c5e6f
+Create Date: 2026-03-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.functions import utcnow
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0b3c4d6f7a"
+down_revision: Union[str, None] = "4d9a2b3c5e6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column(
+            "transaction_date",
+            existing_type=sa.Date(),
+            existing_nullable=False,
+            server_default=sa.func.current_date(),
+        )
+        batch_op.alter_column(
+            "created_date",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=utcnow(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column(
+            "created_date",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "transaction_date",
+            existing_type=sa.Date(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,31 @@
+"""add (user_id, card_id, transaction_date) index on transactions
+
+Revision ID: 6f1c4d5e7a8b
+Revises: 5e0b3c4d6f7a
+Create Date: 2026-03-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f1c4d5e7a8b"
+down_revision: Union[str, None] = "5e0b3c4d6f7a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tx_user_card_date",
+        "transactions",
+        ["user_id", "card_id", "transaction_date"],
+        unique=False,
+        postgresql_include=["amount_sgd"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tx_user_card_date", table_name="transactions")
@@ -0,0 +1,40 @@
+"""server-side default for user_owned_cards.billing_cycle_refresh_date
+
+Revision ID: 7a2c5e8f9b0d
+Revises: 6f1c4d5e7a8b
+Create Date: 2026-03-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.functions import end_of_month
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2c5e8f9b0d"
+down_revision: Union[str, None] = "6f1c4d5e7a8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("user_owned_cards") as batch_op:
+        batch_op.alter_column(
+            "billing_cycle_refresh_date",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=end_of_month(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("user_owned_cards") as batch_op:
+        batch_op.alter_column(
+            "billing_cycle_refresh_date",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
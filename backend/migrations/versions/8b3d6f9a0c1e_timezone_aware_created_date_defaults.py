@@ -0,0 +1,66 @@
+"""timezone-aware created_date columns with server-side defaults
+
+Revision ID: 8b3d6f9a0c1e
+Revises: 7a2c5e8f9b0d
+Create Date: 2026-03-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.functions import utcnow
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3d6f9a0c1e"
+down_revision: Union[str, None] = "7a2c5e8f9b0d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing naive values were written as UTC.
+NAIVE_TABLES = ("user_profile", "transactions")
+
+
+def upgrade() -> None:
+    for table in NAIVE_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_date",
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+                postgresql_using="created_date AT TIME ZONE 'UTC'",
+            )
+
+    with op.batch_alter_table("card_change_notification") as batch_op:
+        batch_op.alter_column(
+            "created_date",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("card_change_notification") as batch_op:
+        batch_op.alter_column(
+            "created_date",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    for table, server_default in (("transactions", utcnow()), ("user_profile", None)):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_date",
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                existing_nullable=False,
+                server_default=server_default,
+                postgresql_using="created_date AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,71 @@
+"""store user_owned_cards.status and user_profile.benefits_preference as strings
+
+Revision ID: 9c4e7a0b1d2f
+Revises: 8b3d6f9a0c1e
+Create Date: 2026-03-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e7a0b1d2f"
+down_revision: Union[str, None] = "8b3d6f9a0c1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLAlchemy's Enum type persisted member names; the String columns hold values.
+# (table, column, enum type name, {member name: value})
+ENUM_COLUMNS = (
+    (
+        "user_owned_cards",
+        "status",
+        "userownedcardstatus",
+        {"Active": "Active", "Inactive": "Suspended", "Closed": "Expired"},
+    ),
+    (
+        "user_profile",
+        "benefits_preference",
+        "benefitspreference",
+        {"miles": "Miles", "cashback": "Cashback", "no_preference": "No preference"},
+    ),
+)
+
+
+def _in_list(values) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table, column, type_name, mapping in ENUM_COLUMNS:
+        if is_postgres:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) USING {column}::text")
+            op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+        for name, value in mapping.items():
+            op.execute(f"UPDATE {table} SET {column} = '{value}' WHERE lower({column}) = lower('{name}')")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.String(), type_=sa.String(16), existing_nullable=False)
+            batch_op.create_check_constraint(f"ck_{table}_{column}", f"{column} IN ({_in_list(mapping.values())})")
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table, column, type_name, mapping in reversed(ENUM_COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f"ck_{table}_{column}", type_="check")
+
+        for name, value in mapping.items():
+            op.execute(f"UPDATE {table} SET {column} = '{name}' WHERE {column} = '{value}'")
+
+        if is_postgres:
+            sa.Enum(*mapping, name=type_name).create(op.get_bind(), checkfirst=True)
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}")
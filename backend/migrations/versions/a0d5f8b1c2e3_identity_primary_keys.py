@@ -0,0 +1,51 @@
+"""identity primary keys for user_profile, user_owned_cards and transactions
+
+Revision ID: a0d5f8b1c2e3
+Revises: 9c4e7a0b1d2f
+Create Date: 2026-03-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a0d5f8b1c2e3"
+down_revision: Union[str, None] = "9c4e7a0b1d2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("user_profile", "user_owned_cards", "transactions")
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table in TABLES:
+        # The primary key is already indexed.
+        op.drop_index(f"ix_{table}_id", table_name=table)
+
+        if is_postgres:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+            op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+            op.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table in reversed(TABLES):
+        if is_postgres:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+            op.execute(f"CREATE SEQUENCE IF NOT EXISTS {table}_id_seq OWNED BY {table}.id")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+            op.execute(
+                f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+            )
+
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
@@ -0,0 +1,41 @@
+"""make user_owned_cards.card_expiry_date nullable instead of a 9999 sentinel
+
+Revision ID: b1e6a9c2d3f4
+Revises: a0d5f8b1c2e3
+Create Date: 2026-03-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b1e6a9c2d3f4"
+down_revision: Union[str, None] = "a0d5f8b1c2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NO_EXPIRY_SENTINEL = "9999-01-01"
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("user_owned_cards") as batch_op:
+        batch_op.alter_column("card_expiry_date", existing_type=sa.DateTime(), nullable=True)
+
+    op.execute(
+        f"UPDATE user_owned_cards SET card_expiry_date = NULL "
+        f"WHERE card_expiry_date >= '{NO_EXPIRY_SENTINEL}'"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"UPDATE user_owned_cards SET card_expiry_date = '{NO_EXPIRY_SENTINEL}' "
+        f"WHERE card_expiry_date IS NULL"
+    )
+
+    with op.batch_alter_table("user_owned_cards") as batch_op:
+        batch_op.alter_column("card_expiry_date", existing_type=sa.DateTime(), nullable=False)
@@ -3,13 +3,31 @@ Run script for CardTrack Backend API
 
 Usage:
     python run.py
+
+Environment:
+    UVICORN_RELOAD   - "0" to disable auto-reload (default "1", for development)
+    UVICORN_WORKERS  - number of worker processes when reload is off (default 1)
+
+Keep a single worker: the recommendation and catalog caches live in process
+memory and are only invalidated in the worker that handled the write, so with
+several workers other processes can serve stale results until the cache TTL
+expires.
 """
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    reload = os.getenv("UVICORN_RELOAD", "1").strip().lower() in ("1", "true", "yes")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True  # Auto-reload on code changes
+        reload=reload,  # Auto-reload on code changes
+        workers=None if reload else int(os.getenv("UVICORN_WORKERS", "1")),
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard],
+        # pulled in by fastapi[standard]) and falls back to asyncio/h11 where
+        # they are unavailable, e.g. uvloop on Windows.
+        loop="auto",
+        http="auto",
     )
@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure `backend/` is on sys.path so `import app...` works
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.explanation_service import clear_explanation_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_explanation_cache():
+    # LLM answers are cached per prompt for the whole process; tests mock the
+    # client differently, so each one starts with an empty cache.
+    clear_explanation_cache()
+    yield
+    clear_explanation_cache()
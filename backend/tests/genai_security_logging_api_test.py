@@ -147,7 +147,7 @@ class GenAISecurityLoggingApiTests(unittest.TestCase):
             "comparison_cards": [],
         }
 
-        with patch("app.routes.card_reasoner.generate_explanation", side_effect=Exception("boom")):
+        with patch("app.routes.card_reasoner.generate_explanation_async", side_effect=Exception("boom")):
             resp = self.client.post(
                 "/api/v1/card-reasoner/explain",
                 json=payload,
@@ -22,6 +22,9 @@ from app.models.user_profile import UserProfile, BenefitsPreference  # noqa: E40
 from app.models.card_catalogue import CardCatalogue, BankEnum, BenefitTypeEnum, StatusEnum  # noqa: E402
 from app.models.card_bonus_category import CardBonusCategory, BonusCategory  # noqa: E402
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus  # noqa: E402
+from app.routes.recommendation import RecommendationCard, _card_from_dto  # noqa: E402
+from app.services.recommendation_service import RecommendationService, invalidate_recommendations  # noqa: E402
+from app.schemas.ai_schemas import ExplanationResponse  # noqa: E402
 from app.models.transaction import UserTransaction  # noqa: F401,E402  # Imported to ensure SQLAlchemy relationships/metadata are registered
 
 
@@ -156,6 +159,7 @@ class RecommendationApiTests(unittest.TestCase):
 
         self.assertEqual(resp.status_code, 200, msg=f"Expected 200, got {resp.status_code}: {resp.text}")
         data = resp.json()
+        self.assertEqual(set(data), set(ExplanationResponse.model_fields))
         
         # Verify fallback was used
         self.assertTrue(
@@ -213,6 +217,52 @@ class RecommendationApiTests(unittest.TestCase):
         self.assertEqual(resp_cb.status_code, 200)
         self.assertEqual(resp_cb.json()["recommended"]["reward_unit"], "cashback")
 
+    def test_missing_user_id_is_rejected_before_opening_a_session(self):
+        opened = []
+
+        def tracking_get_db():
+            opened.append(True)
+            yield self.Session()
+
+        app.dependency_overrides[get_db] = tracking_get_db
+        resp = self.client.get("/api/v1/recommendation", params={"category": "Food"})
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["detail"]["error"]["code"], "VALIDATION_ERROR")
+        self.assertEqual(opened, [])
+
+    def test_card_dicts_match_the_response_model(self):
+        # Cards are encoded as plain dicts without response_model validation;
+        # validating them must not change any value.
+        with self.Session() as db:
+            _, ranked = RecommendationService(db).recommend(
+                user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("50"), preference=None
+            )
+
+        card = _card_from_dto(ranked[0])
+        self.assertEqual(RecommendationCard.model_validate(card).model_dump(), card)
+        self.assertIsInstance(card["card_id"], int)
+        self.assertIsInstance(card["base_benefit_rate"], float)
+        self.assertIsInstance(card["current_cycle_spend_sgd"], float)
+        self.assertIsInstance(card["bonus_rules"], list)
+        self.assertIsInstance(card["reward_breakdown"], dict)
+
+    def test_repeat_recommendation_reuses_encoded_body(self):
+        params = {"user_id": 1, "category": "Food", "amount_sgd": "50"}
+        with patch("app.routes.recommendation._card_from_dto", wraps=_card_from_dto) as convert:
+            first = self.client.get("/api/v1/recommendation", params=params)
+            second = self.client.get("/api/v1/recommendation", params=params)
+            self.assertEqual(convert.call_count, 2)  # recommended + one ranked card
+
+            invalidate_recommendations(1)
+            third = self.client.get("/api/v1/recommendation", params=params)
+            self.assertEqual(convert.call_count, 4)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["content-type"], "application/json")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(third.json(), first.json())
+
 
 if __name__ == "__main__":
     unittest.main()
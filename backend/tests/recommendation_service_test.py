@@ -1,9 +1,11 @@
 import sys
 import unittest
+from datetime import timedelta
 from decimal import Decimal
 from pathlib import Path
+from unittest.mock import Mock, patch
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -18,8 +20,9 @@ from app.models.user_profile import UserProfile, BenefitsPreference  # noqa: E40
 from app.models.card_catalogue import CardCatalogue, BankEnum, BenefitTypeEnum, StatusEnum  # noqa: E402
 from app.models.card_bonus_category import CardBonusCategory, BonusCategory  # noqa: E402
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus  # noqa: E402
-from app.models.transaction import UserTransaction  # noqa: F401,E402
-from app.services.recommendation_service import RecommendationService  # noqa: E402
+from app.models.transaction import UserTransaction  # noqa: E402
+from app.services.recommendation_service import RecommendationService, invalidate_recommendations  # noqa: E402
+from app.services.explanation_service import ExplanationService  # noqa: E402
 
 
 class RecommendationServiceTests(unittest.TestCase):
@@ -190,6 +193,139 @@ class RecommendationServiceTests(unittest.TestCase):
             self.assertIsNotNone(best_cb)
             self.assertEqual(best_cb.reward_unit, "cashback")
 
+    def test_current_cycle_spend_is_summed_per_card(self):
+        with self.Session() as db:
+            card_a = db.query(UserOwnedCard).filter(UserOwnedCard.card_id == 10).one()
+            cycle_start = RecommendationService._latest_cycle_start_date(
+                card_a.billing_cycle_refresh_date.day
+            )
+
+            def txn(card_id, amount, txn_date):
+                return UserTransaction(
+                    user_id=1,
+                    card_id=card_id,
+                    amount_sgd=Decimal(amount),
+                    item="x",
+                    channel="online",
+                    category="Food",
+                    is_overseas=False,
+                    transaction_date=txn_date,
+                )
+
+            db.add_all(
+                [
+                    txn(10, "120.50", cycle_start),
+                    txn(10, "30.00", cycle_start),
+                    txn(10, "999.00", cycle_start - timedelta(days=1)),
+                    txn(20, "45.25", cycle_start),
+                ]
+            )
+            db.commit()
+
+            _, ranked = RecommendationService(db).recommend(user_id=1)
+            spend = {r.card_id: r.current_cycle_spend_sgd for r in ranked}
+            self.assertEqual(spend[10], Decimal("150.50"))
+            self.assertEqual(spend[20], Decimal("45.25"))
+
+    def test_recommend_query_count_does_not_grow_with_cards(self):
+        # user, wallet, cycle spend, catalog rows and bonus rules: one query
+        # each, however many cards the user owns.
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with self.Session() as db:
+            engine = db.get_bind()
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                _, ranked = RecommendationService(db).recommend(
+                    user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800")
+                )
+                for card in ranked:
+                    card.bonus_rules
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+        self.assertEqual(len(ranked), 2)
+        self.assertLessEqual(len(statements), 5)
+
+    def test_batched_explanation_contexts_match_single_builds(self):
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with self.Session() as db:
+            service = ExplanationService(db)
+            expected = [
+                service.build_context_from_db(card_id, "Food", Decimal("800"))
+                for card_id in (20, 10)
+            ]
+
+            engine = db.get_bind()
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                contexts = service.build_contexts_from_db([20, 10], "Food", Decimal("800"))
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+            with self.assertRaises(ValueError):
+                service.build_contexts_from_db([10, 999], "Food", Decimal("800"))
+
+        self.assertEqual(contexts, expected)
+        self.assertTrue(contexts[1].is_bonus_eligible)
+        self.assertEqual(len(statements), 2)
+
+    def test_cached_recommendation_is_reused_until_invalidated(self):
+        with self.Session() as db:
+            service = RecommendationService(db)
+            first = service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            self.assertIs(service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800")), first)
+            self.assertIsNot(service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("100")), first)
+
+            invalidate_recommendations(1)
+            again = service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            self.assertIsNot(again, first)
+            self.assertEqual(again, first)
+
+    def test_result_invalidated_while_computing_is_not_cached(self):
+        with self.Session() as db:
+            service = RecommendationService(db)
+            recommend = service.recommend
+
+            def recommend_then_write(**kwargs):
+                result = recommend(**kwargs)
+                invalidate_recommendations(1)  # a write commits mid-computation
+                return result
+
+            with patch.object(service, "recommend", side_effect=recommend_then_write):
+                stale = service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            fresh = service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            self.assertIsNot(fresh, stale)
+            self.assertIs(
+                service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800")), fresh
+            )
+
+    def test_encoded_body_shares_the_cached_entry(self):
+        encode = Mock(side_effect=lambda result: repr(result).encode())
+        with self.Session() as db:
+            service = RecommendationService(db)
+            result = service.recommend_cached(user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            cached, body = service.recommend_cached_encoded(
+                encode, user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800")
+            )
+            self.assertIs(cached, result)
+            _, again = service.recommend_cached_encoded(
+                encode, user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800")
+            )
+            self.assertIs(again, body)
+            self.assertEqual(encode.call_count, 1)
+
+            invalidate_recommendations(1)
+            service.recommend_cached_encoded(encode, user_id=1, category=BonusCategory.Food, amount_sgd=Decimal("800"))
+            self.assertEqual(encode.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
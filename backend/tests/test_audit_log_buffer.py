@@ -0,0 +1,63 @@
+import asyncio
+
+from app.services import card_reasoner_service
+from app.services.card_reasoner_service import AuditLogBuffer, AuditLogEntry
+
+
+def _entry(card_id: int) -> AuditLogEntry:
+    return AuditLogEntry(
+        timestamp="2026-03-20T00:00:00+00:00",
+        model_used="gpt-4o-mini",
+        merchant_name="ZARA",
+        category="Fashion",
+        recommended_card_id=card_id,
+        recommended_card_name=f"Card {card_id}",
+        num_comparisons=0,
+    )
+
+
+def test_buffered_entries_are_written_in_one_batch(monkeypatch):
+    batches = []
+    monkeypatch.setattr(card_reasoner_service, "save_audit_logs", lambda entries: batches.append(entries))
+
+    async def scenario():
+        buffer = AuditLogBuffer(flush_interval_seconds=60)
+        await buffer.start()
+        for card_id in (1, 2, 3):
+            buffer.put(_entry(card_id))
+        assert batches == []
+        await buffer.stop()
+
+    asyncio.run(scenario())
+
+    assert len(batches) == 1
+    assert [entry.recommended_card_id for entry in batches[0]] == [1, 2, 3]
+
+
+def test_full_batch_is_flushed_before_the_interval(monkeypatch):
+    batches = []
+    monkeypatch.setattr(card_reasoner_service, "save_audit_logs", lambda entries: batches.append(entries))
+
+    async def scenario():
+        buffer = AuditLogBuffer(flush_interval_seconds=60, max_batch_size=2)
+        await buffer.start()
+        buffer.put(_entry(1))
+        buffer.put(_entry(2))
+        for _ in range(50):
+            if batches:
+                break
+            await asyncio.sleep(0.01)
+        await buffer.stop()
+
+    asyncio.run(scenario())
+
+    assert [len(batch) for batch in batches] == [2]
+
+
+def test_entries_are_written_immediately_when_not_started(monkeypatch):
+    saved = []
+    monkeypatch.setattr(card_reasoner_service, "save_audit_log", lambda entry: saved.append(entry))
+
+    AuditLogBuffer().put(_entry(1))
+
+    assert [entry.recommended_card_id for entry in saved] == [1]
@@ -16,6 +16,7 @@ from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.user_profile import BenefitsPreference, UserProfile
 from app.routes.catalog import router as catalog_router
 from app.routes.notifications import router as notifications_router
+from app.services.catalog_service import invalidate_catalog_cache
 
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
@@ -215,3 +216,27 @@ def test_no_delta_creates_no_notification(client: TestClient):
         assert db.query(CardChangeNotification).count() == 0
     finally:
         db.close()
+
+
+def test_catalog_etag_revalidates_and_changes_after_reward_update(client: TestClient):
+    invalidate_catalog_cache()
+
+    first = client.get("/api/v1/catalog/")
+    assert first.status_code == 200
+    assert [card["card_id"] for card in first.json()] == [101, 202]
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "max-age=60"
+
+    not_modified = client.get("/api/v1/catalog/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.put(
+        "/api/v1/catalog/101/rewards",
+        json={"reward_update": {"base_benefit_rate": 0.02, "effective_date": "2026-04-01"}},
+    )
+
+    updated = client.get("/api/v1/catalog/", headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.headers["etag"] != etag
+    assert updated.json()[0]["base_benefit_rate"] == "0.0200"
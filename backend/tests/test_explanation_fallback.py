@@ -13,12 +13,14 @@ Expected behavior:
 - System logs the fallback event
 """
 
+import asyncio
 import sys
+import time
 import unittest
 import logging
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -41,6 +43,8 @@ from app.models.card_catalogue import CardCatalogue, BankEnum, BenefitTypeEnum,
 from app.models.card_bonus_category import CardBonusCategory, BonusCategory
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.transaction import UserTransaction  # noqa: F401
+from app.models.security_log import SecurityLog
+from app.services.security_log_service import SecurityEventType
 
 
 class TestExplanationFallback(unittest.TestCase):
@@ -314,6 +318,163 @@ class TestExplanationFallback(unittest.TestCase):
                 "Expected actual model name when AI succeeds"
             )
 
+    def test_explain_db_awaits_async_client(self):
+        """
+        Test 5b: /explain-db uses the async OpenAI client and falls back on timeout
+        """
+        with patch("app.services.explanation_service.async_openai_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=APITimeoutError(request=MagicMock())
+            )
+
+            response = self.client.post(
+                "/api/v1/card-reasoner/explain-db",
+                json={"card_id": 1, "category": "Fashion", "transaction_amount": 100.00},
+            )
+
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertTrue(data.get("is_fallback"))
+            self.assertEqual(data.get("model_used"), "template_timeout")
+            mock_client.chat.completions.create.assert_awaited_once()
+
+    def test_explain_db_falls_back_when_llm_exceeds_deadline(self):
+        """
+        Test 5b0: a call slower than LLM_REQUEST_TIMEOUT is abandoned for the template
+        """
+        async def never_finishes(**_kwargs):
+            await asyncio.sleep(10)
+
+        with patch("app.services.explanation_service.async_openai_client") as mock_client, \
+                patch("app.services.explanation_service.LLMConfig.REQUEST_TIMEOUT_SECONDS", 0.05):
+            mock_client.chat.completions.create = never_finishes
+
+            response = self.client.post(
+                "/api/v1/card-reasoner/explain-db",
+                json={"card_id": 1, "category": "Fashion", "transaction_amount": 100.00},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["is_fallback"])
+        self.assertEqual(response.json()["model_used"], "template_timeout")
+
+    def test_explain_db_reuses_cached_llm_explanation(self):
+        """
+        Test 5b1: a repeated /explain-db request is answered from the LLM cache
+        """
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = "Cached AI explanation."
+        body = {"card_id": 1, "category": "Fashion", "transaction_amount": 100.00}
+
+        with patch("app.services.explanation_service.async_openai_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=llm_response)
+
+            first = self.client.post("/api/v1/card-reasoner/explain-db", json=body)
+            second = self.client.post("/api/v1/card-reasoner/explain-db", json=body)
+            other_amount = self.client.post(
+                "/api/v1/card-reasoner/explain-db", json={**body, "transaction_amount": 105.00}
+            )
+
+        self.assertEqual(second.json()["explanation"], "Cached AI explanation.")
+        self.assertFalse(second.json()["is_fallback"])
+        self.assertEqual(first.json()["explanation"], second.json()["explanation"])
+        self.assertEqual(other_amount.status_code, 200)
+        # The repeat is served from cache; a different amount is a new prompt.
+        self.assertEqual(mock_client.chat.completions.create.await_count, 2)
+
+    def test_explain_db_persists_audit_log_for_user(self):
+        """
+        Test 5b2: /explain-db stores an audit entry in its own session after responding
+        """
+        with patch("app.services.explanation_service.async_openai_client", None):
+            response = self.client.post(
+                "/api/v1/card-reasoner/explain-db",
+                json={"card_id": 1, "category": "Fashion", "transaction_amount": 100.00, "user_id": 1},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        with self.Session() as db:
+            audit = (
+                db.query(SecurityLog)
+                .filter(SecurityLog.event_type == "genai.explanation_audit")
+                .one()
+            )
+        self.assertEqual(audit.user_id, 1)
+        self.assertEqual(audit.details["card_id"], 1)
+        self.assertEqual(audit.details["model_used"], "template")
+
+    def test_explain_db_stream_sends_sse_chunks(self):
+        """
+        Test 5c: /explain-db/stream forwards LLM deltas as SSE events
+        """
+        async def fake_stream():
+            for text in ("Great ", "card\nfor you."):
+                chunk = MagicMock()
+                chunk.choices[0].delta.content = text
+                yield chunk
+
+        with patch("app.services.explanation_service.async_openai_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+            response = self.client.post(
+                "/api/v1/card-reasoner/explain-db/stream",
+                json={"card_id": 1, "category": "Fashion", "transaction_amount": 100.00},
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+            self.assertEqual(
+                response.text,
+                "data: Great \n\n"
+                "data: card\ndata: for you.\n\n"
+                "event: done\ndata: [DONE]\n\n",
+            )
+            self.assertTrue(mock_client.chat.completions.create.call_args.kwargs["stream"])
+
+        # The access event is written once the stream has completed.
+        with self.Session() as db:
+            access = db.query(SecurityLog).filter(SecurityLog.event_type == SecurityEventType.GENAI_ACCESS).one()
+        self.assertEqual(access.event_status, "success")
+        self.assertTrue(access.details["streaming"])
+
+    def test_explain_db_stream_ends_when_llm_stalls_mid_stream(self):
+        """
+        Test 5c2: LLM_REQUEST_TIMEOUT also bounds a stream that stops sending deltas
+        """
+        async def stalled_stream():
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = "Great "
+            yield chunk
+            await asyncio.sleep(10)
+
+        with patch("app.services.explanation_service.async_openai_client") as mock_client, \
+                patch("app.services.explanation_service.LLMConfig.REQUEST_TIMEOUT_SECONDS", 0.2):
+            mock_client.chat.completions.create = AsyncMock(return_value=stalled_stream())
+
+            started = time.monotonic()
+            response = self.client.post(
+                "/api/v1/card-reasoner/explain-db/stream",
+                json={"card_id": 1, "category": "Fashion", "transaction_amount": 100.00},
+            )
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "data: Great \n\nevent: error\ndata: [INTERRUPTED]\n\n")
+        self.assertLess(elapsed, 2)
+        with self.Session() as db:
+            access = db.query(SecurityLog).filter(SecurityLog.event_type == SecurityEventType.GENAI_ACCESS).one()
+        self.assertEqual(access.event_status, "failed")
+
+    def test_explain_db_stream_unknown_card_returns_404(self):
+        """
+        Test 5d: /explain-db/stream still reports a missing card as JSON 404
+        """
+        response = self.client.post(
+            "/api/v1/card-reasoner/explain-db/stream",
+            json={"card_id": 999, "category": "Fashion", "transaction_amount": 100.00},
+        )
+        self.assertEqual(response.status_code, 404)
+
 
 # Pytest-based tests for logging verification (require caplog fixture)
 @pytest.fixture
@@ -10,7 +10,6 @@ from fastapi import HTTPException
 class ServiceException(Exception):
     pass
 from app.services.rewards_earned_service import RewardsEarnedService
-from app.models.transaction import UserTransaction, TransactionCategory, TransactionChannel
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus
 from app.models.card_catalogue import CardCatalogue
 from app.models.card_bonus_category import BonusCategory, CardBonusCategory
@@ -22,6 +21,9 @@ class MockQuery:
     
     def filter(self, *args, **kwargs):
         return self
+
+    def options(self, *args, **kwargs):
+        return self
     
     def first(self):
         return self.result[0] if self.result else None
@@ -39,7 +41,7 @@ def rewards_earned_service(mock_db):
 
 def test_calculate_rewards_earned_no_active_cards(rewards_earned_service, mock_db):
     # Mock the database query to return no active cards
-    mock_db.query().filter().all.return_value = []
+    mock_db.query().options().filter().all.return_value = []
     
     result = rewards_earned_service.calculate_rewards_earned(user_id=1)
     
@@ -50,14 +52,14 @@ def test_calculate_rewards_earned_with_active_cards(rewards_earned_service, mock
     active_card = UserOwnedCard(id=1, user_id=1, card_id=1, status=UserOwnedCardStatus.active, billing_cycle_refresh_day_of_mth=1)
     card_catalogue = CardCatalogue(card_id=1, bank="Test Bank", card_name="Test Card", benefit_type="cashback", base_benefit_rate=0.01, status="active")
     bonus_category = CardBonusCategory(card_id=1, bonus_category=BonusCategory.Food, bonus_benefit_rate=0.2, bonus_cap_in_dollar=100)
-    transaction = UserTransaction(id=1, user_id=1, card_id=1, amount_sgd=100, item="test", channel=TransactionChannel.online, is_overseas=False, category=TransactionCategory.food, transaction_date="2024-06-01")
     
     # Build a side_effect list that returns appropriate objects based on query order
+    # Catalogue and bonus rules are eager-loaded onto the owned card.
+    active_card.card_catalogue = card_catalogue
+    card_catalogue.bonus_categories = [bonus_category]
     query_results = [
-        [active_card],        # 1st call: query(UserOwnedCard).filter().all()
-        [card_catalogue],     # 2nd call: query(CardCatalogue).filter().first()
-        [bonus_category],     # 3rd call: query(CardBonusCategory).filter().all()
-        [transaction]         # 4th call: query(UserTransaction).filter().all()
+        [active_card],        # 1st call: query(UserOwnedCard).options().filter().all()
+        [(100.0, 100.0)]      # 2nd call: (total, bonus) spend sums for the card
     ]
     
     # Set up mock_db.query() to return appropriate MockQuery objects
@@ -76,11 +78,10 @@ def test_calculate_rewards_earned_with_no_transactions(rewards_earned_service, m
     active_card = UserOwnedCard(id=1, user_id=1, card_id=1, status=UserOwnedCardStatus.active, billing_cycle_refresh_day_of_mth=1)
     card_catalogue = CardCatalogue(card_id=1, bank="Test Bank", card_name="Test Card", benefit_type="cashback", base_benefit_rate=0.01, status="active")
     
+    active_card.card_catalogue = card_catalogue  # no bonus categories
     mock_db.query.side_effect = [
-        MockQuery([active_card]),  # Active cards query
-        MockQuery([card_catalogue]),  # Card catalogue query
-        MockQuery([]),  # Bonus categories query (no bonus categories)
-        MockQuery([])   # Transactions query (no transactions)
+        MockQuery([active_card]),  # Active cards query (catalogue eager-loaded)
+        MockQuery([])   # Spend sums query (no transactions)
     ]
     
     result = rewards_earned_service.calculate_rewards_earned(user_id=1)
@@ -95,13 +96,12 @@ def test_calculate_rewards_earned_with_bonus_cap_exceeded(rewards_earned_service
     active_card = UserOwnedCard(id=1, user_id=1, card_id=1, status=UserOwnedCardStatus.active, billing_cycle_refresh_day_of_mth=1)
     card_catalogue = CardCatalogue(card_id=1, bank="Test Bank", card_name="Test Card", benefit_type="cashback", base_benefit_rate=0.01, status="active")
     bonus_category = CardBonusCategory(card_id=1, bonus_category=BonusCategory.Food, bonus_benefit_rate=0.2, bonus_cap_in_dollar=100)
-    transaction = UserTransaction(id=1, user_id=1, card_id=1, amount_sgd=600, item="test", channel=TransactionChannel.online, is_overseas=False, category=TransactionCategory.food, transaction_date="2024-06-01")
     
+    active_card.card_catalogue = card_catalogue
+    card_catalogue.bonus_categories = [bonus_category]
     mock_db.query.side_effect = [
-        MockQuery([active_card]),  # Active cards query
-        MockQuery([card_catalogue]),  # Card catalogue query
-        MockQuery([bonus_category]),  # Bonus categories query
-        MockQuery([transaction])   # Transactions query
+        MockQuery([active_card]),  # Active cards query (catalogue + bonus rules eager-loaded)
+        MockQuery([(600.0, 600.0)])   # (total, bonus) spend sums
     ]
     
     result = rewards_earned_service.calculate_rewards_earned(user_id=1)
@@ -115,13 +115,11 @@ def test_calculate_rewards_earned_with_bonus_cap_exceeded(rewards_earned_service
 def test_calculate_rewards_earned_with_no_bonus_categories(rewards_earned_service, mock_db):
     active_card = UserOwnedCard(id=1, user_id=1, card_id=1, status=UserOwnedCardStatus.active, billing_cycle_refresh_day_of_mth=1)
     card_catalogue = CardCatalogue(card_id=1, bank="Test Bank", card_name="Test Card", benefit_type="cashback", base_benefit_rate=0.01, status="active")
-    transaction = UserTransaction(id=1, user_id=1, card_id=1, amount_sgd=100, item="test", channel=TransactionChannel.online, is_overseas=False, category=TransactionCategory.food, transaction_date="2024-06-01")
     
+    active_card.card_catalogue = card_catalogue  # no bonus categories
     mock_db.query.side_effect = [
-        MockQuery([active_card]),  # Active cards query
-        MockQuery([card_catalogue]),  # Card catalogue query
-        MockQuery([]),  # Bonus categories query (no bonus categories)
-        MockQuery([transaction])   # Transactions query
+        MockQuery([active_card]),  # Active cards query (catalogue eager-loaded)
+        MockQuery([(100.0, 0.0)])   # (total, bonus) spend sums
     ]
     
     result = rewards_earned_service.calculate_rewards_earned(user_id=1)
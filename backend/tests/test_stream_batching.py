@@ -0,0 +1,49 @@
+import asyncio
+
+from app.services.explanation_service import batch_stream
+
+
+async def _collect(chunks, **settings):
+    return [batch async for batch in batch_stream(chunks, **settings)]
+
+
+def test_batches_grow_from_a_single_chunk():
+    async def tokens():
+        for i in range(10):
+            yield str(i)
+
+    batches = asyncio.run(
+        _collect(tokens(), max_batch_size=4, growth_factor=3, flush_interval_ms=1000)
+    )
+
+    # 1, then 3, then capped at 4; the remainder is flushed at the end.
+    assert batches == ["0", "123", "4567", "89"]
+
+
+def test_partial_batch_is_flushed_after_interval():
+    async def slow_tokens():
+        yield "a"
+        yield "b"
+        await asyncio.sleep(0.2)
+        yield "c"
+
+    batches = asyncio.run(
+        _collect(slow_tokens(), max_batch_size=50, growth_factor=10, flush_interval_ms=20)
+    )
+
+    assert batches == ["a", "b", "c"]
+
+
+def test_stream_errors_are_raised():
+    async def failing():
+        yield "a"
+        raise RuntimeError("boom")
+
+    async def scenario():
+        try:
+            await _collect(failing(), max_batch_size=5, growth_factor=2, flush_interval_ms=10)
+        except RuntimeError as e:
+            return str(e)
+        return None
+
+    assert asyncio.run(scenario()) == "boom"
@@ -229,4 +229,40 @@ def test_bulk_update_transaction_status(client: TestClient):
 def test_transactions_requires_user_context(client: TestClient):
     response = client.get("/api/v1/transactions")
     assert response.status_code == 401
-    assert response.json()["error"]["code"] == "UNAUTHORIZED"
\ No newline at end of file
+    assert response.json()["error"]["code"] == "UNAUTHORIZED"
+
+def test_missing_user_context_is_rejected_before_body_validation(client: TestClient):
+    response = client.post("/api/v1/transactions", json={"transaction": {"amount_sgd": "oops"}})
+    assert response.status_code == 401
+    assert response.json()["error"]["details"] == {"required_header": "x-user-id"}
+
+
+def test_bulk_update_with_no_ids_updates_nothing(client: TestClient):
+    response = client.put(
+        "/api/v1/transactions/bulk/status",
+        json={"transaction_ids": [], "status": "deleted_with_card"},
+        headers=USER_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"count": 0, "status": "deleted_with_card"}
+
+
+def test_bulk_update_spans_multiple_chunks(client: TestClient, monkeypatch):
+    import app.services.transaction_service as transaction_service
+
+    monkeypatch.setattr(transaction_service, "chunk_size_for", lambda session: 1)
+    first = _create_transaction(client, _transaction_payload(item="First txn", date="2026-02-15"))
+    second = _create_transaction(client, _transaction_payload(item="Second txn", date="2026-02-16"))
+
+    response = client.put(
+        "/api/v1/transactions/bulk/status",
+        json={
+            "transaction_ids": [int(first["id"]), int(second["id"])],
+            "status": "deleted_with_card",
+        },
+        headers=USER_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
@@ -124,6 +124,16 @@ class UserCardServiceTests(unittest.TestCase):
 			self.assertEqual(created.billing_cycle_refresh_day_of_month, 15)
 			self.assertEqual(created.status, UserOwnedCardStatus.Active)
 
+	def test_add_user_card_defaults(self):
+		with self.Session() as db:
+			service = UserCardManagementService(db)
+
+			created = service.add_user_card("sub-alice", 101, UserOwnedCardCreate(card_id=101))
+
+			self.assertIsNone(created.card_expiry_date)
+			self.assertIsNotNone(created.billing_cycle_refresh_date)
+			self.assertEqual(created.billing_cycle_refresh_day_of_month, 1)
+
 	def test_add_user_card_duplicate(self):
 		with self.Session() as db:
 			service = UserCardManagementService(db)
@@ -179,6 +189,22 @@ class UserCardServiceTests(unittest.TestCase):
 
 			self.assertEqual(updated.billing_cycle_refresh_day_of_month, original_day)
 
+	def test_update_user_card_writes_renamed_column(self):
+		with self.Session() as db:
+			service = UserCardManagementService(db)
+			service.add_user_card("sub-alice", 101, UserOwnedCardCreate(card_id=101))
+
+			updated = service.update_user_card(
+				"sub-alice",
+				101,
+				UserOwnedCardUpdate(billing_cycle_refresh_day_of_month=15),
+			)
+			self.assertEqual(updated.billing_cycle_refresh_day_of_month, 15)
+
+		with self.Session() as db:
+			stored = db.query(UserOwnedCard).filter(UserOwnedCard.card_id == 101).one()
+			self.assertEqual(stored.billing_cycle_refresh_day_of_month, 15)
+
 	def test_update_user_card_not_found(self):
 		with self.Session() as db:
 			service = UserCardManagementService(db)
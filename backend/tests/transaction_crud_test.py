@@ -6,7 +6,7 @@ from pathlib import Path
 from datetime import date
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -23,6 +23,9 @@ from app.models.user_profile import UserProfile, BenefitsPreference  # noqa: E40
 from app.models.card_catalogue import CardCatalogue, BankEnum, BenefitTypeEnum, StatusEnum  # noqa: E402
 from app.models.user_owned_cards import UserOwnedCard, UserOwnedCardStatus  # noqa: E402
 from app.models.transaction import UserTransaction, TransactionChannel, TransactionCategory, TransactionStatus  # noqa: E402
+from app.services.transaction_service import TransactionService  # noqa: E402
+from app.services.errors import ServiceError  # noqa: E402
+from app.dependencies.user_context import get_x_user_id_int  # noqa: E402
 
 
 class TransactionCRUDTests(unittest.TestCase):
@@ -184,6 +187,55 @@ class TransactionCRUDTests(unittest.TestCase):
         self.assertIn("error", data)
         self.assertEqual(data["error"]["code"], "VALIDATION_ERROR")
 
+    def test_create_transactions_batch_success(self):
+        """Test creating several transactions in one batch request"""
+        resp = self.client.post(
+            "/api/v1/transactions/batch",
+            headers={"x-user-id": "1"},
+            json={
+                "transactions": [
+                    {"card_id": 10, "amount_sgd": 12.50, "item": "GrabFood", "channel": "online", "category": "Food"},
+                    {"card_id": 10, "amount_sgd": 4.20, "item": "Kopi", "channel": "offline", "date": "2026-03-05"},
+                ]
+            },
+        )
+        self.assertEqual(resp.status_code, 201)
+        txns = resp.json()["transactions"]
+        self.assertEqual([t["item"] for t in txns], ["GrabFood", "Kopi"])
+        self.assertEqual(txns[1]["date"], "2026-03-05")
+        self.assertEqual(txns[1]["channel"], "offline")
+        self.assertNotEqual(txns[0]["id"], txns[1]["id"])
+
+        list_resp = self.client.get("/api/v1/transactions", headers={"x-user-id": "1"})
+        self.assertEqual(len(list_resp.json()["transactions"]), 3)
+
+    def test_create_transactions_batch_invalid_card_saves_nothing(self):
+        """Test a batch with a card outside the wallet is rejected as a whole"""
+        resp = self.client.post(
+            "/api/v1/transactions/batch",
+            headers={"x-user-id": "1"},
+            json={
+                "transactions": [
+                    {"card_id": 10, "amount_sgd": 12.50, "item": "GrabFood", "channel": "online"},
+                    {"card_id": 999, "amount_sgd": 4.20, "item": "Kopi", "channel": "offline"},
+                ]
+            },
+        )
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["detail"]["error"]["code"], "VALIDATION_ERROR")
+
+        list_resp = self.client.get("/api/v1/transactions", headers={"x-user-id": "1"})
+        self.assertEqual(len(list_resp.json()["transactions"]), 1)
+
+    def test_create_transactions_batch_no_user_header(self):
+        """Test batch creation without x-user-id header"""
+        resp = self.client.post(
+            "/api/v1/transactions/batch",
+            json={"transactions": [{"card_id": 10, "amount_sgd": 1, "item": "Test", "channel": "online"}]},
+        )
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(resp.json()["error"]["code"], "UNAUTHORIZED")
+
     # ========== GET TESTS ==========
 
     def test_list_transactions(self):
@@ -344,6 +396,62 @@ class TransactionCRUDTests(unittest.TestCase):
         data = resp.json()
         self.assertEqual(data["detail"]["error"]["code"], "VALIDATION_ERROR")
 
+    def test_update_status_invalid_value_rejected_before_user_lookup(self):
+        """A bad status fails validation before the username is looked up"""
+        resp = self.client.put(
+            "/api/v1/transactions/100/status",
+            headers={"x-user-id": "no_such_user"},
+            json={"status": "invalid_status"},
+        )
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["detail"]["error"]["code"], "VALIDATION_ERROR")
+
+    def test_user_id_header_forms_match_audit_parsing(self):
+        """Transactions and the genai audit log read x-user-id the same way"""
+        with self.Session() as db:
+            service = TransactionService(db)
+            for header in ("1", "u_001"):
+                self.assertEqual(service._resolve_user_id(header), 1)
+                self.assertEqual(get_x_user_id_int(header), 1)
+            # "u1" is not an id form; it is looked up as a username.
+            self.assertIsNone(get_x_user_id_int("u1"))
+            with self.assertRaises(ServiceError):
+                service._resolve_user_id("u1")
+
+    def test_list_transactions_is_one_query(self):
+        """History is one SELECT however many transactions the user has"""
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with self.Session() as db:
+            db.add_all(
+                UserTransaction(
+                    user_id=1,
+                    card_id=10,
+                    amount_sgd=Decimal("5.00"),
+                    item=f"Item {i}",
+                    channel=TransactionChannel.online,
+                    category=TransactionCategory.food,
+                    is_overseas=False,
+                    transaction_date=date(2026, 3, 2),
+                    status=TransactionStatus.Active,
+                )
+                for i in range(20)
+            )
+            db.commit()
+
+            engine = db.get_bind()
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                transactions = TransactionService(db).get_user_transactions("1")
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+        self.assertEqual(len(transactions), 21)
+        self.assertEqual(len(statements), 1)
+
     # ========== DELETE TESTS ==========
 
     def test_delete_transaction_success(self):